@@ -5,13 +5,50 @@ This module defines the API routes for handling BlockCypher webhook callbacks.
 Part of the v1 API for the payment gateway application.
 """
 
-from app.infrastructure.providers.blockcypher.webhooks import BlockcypherWebhookHandler, simulate_webhook
-from fastapi import APIRouter, Request, HTTPException
-from typing import Optional
+from app.core.cache import get_redis
+from app.core.config import settings
+from app.infrastructure.providers.blockcypher.common.types import BlockcypherWebhookPayload
+from app.infrastructure.providers.blockcypher.webhooks import (
+    BlockcypherWebhookHandler,
+    simulate_webhook,
+    verify_webhook_signature,
+)
+from fastapi import APIRouter, BackgroundTasks, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter, ValidationError
+from starlette.concurrency import run_in_threadpool
+from typing import Any, Dict, Optional
+import orjson
 
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 
-@router.post("/payment")
+# How long BlockCypher redeliveries are remembered for de-duplication
+WEBHOOK_DEDUP_TTL = 24 * 60 * 60
+
+# Built once; validate_json parses and validates the raw body in a single pass
+webhook_payload_adapter = TypeAdapter(BlockcypherWebhookPayload)
+
+# Error bodies are serialized once. A fresh Response wraps them on each request
+# because middleware (e.g. CORS) mutates the headers of the response it sends.
+_INVALID_SIGNATURE_BODY = orjson.dumps({"detail": "Invalid webhook signature"})
+_NOT_FOUND_BODY = orjson.dumps({"detail": "Transaction not found"})
+
+async def _process_webhook(request_data: bytes, request_json: Dict[str, Any], dedup_key: Optional[str]) -> None:
+    """
+    Run the webhook handler in the threadpool.
+    
+    If the handler fails, the de-duplication claim is released so that
+    BlockCypher's retry of the same delivery is processed instead of dropped.
+    """
+    try:
+        await run_in_threadpool(BlockcypherWebhookHandler.handle_payment_webhook, request_data, request_json)
+    except Exception:
+        redis = get_redis()
+        if redis is not None and dedup_key is not None:
+            await redis.delete(dedup_key)
+        raise
+
+@router.post("/payment", status_code=status.HTTP_202_ACCEPTED, response_class=ORJSONResponse)
 async def payment_webhook(request: Request):
     """
     Endpoint for receiving BlockCypher webhook callbacks for payment processing.
@@ -21,25 +58,56 @@ async def payment_webhook(request: Request):
     - Transaction confirmations
     - Double-spend detections
     
+    Only the body is read and decoded inline; the handler itself is scheduled
+    as a background task (run in the threadpool) so slow processing never
+    blocks the event loop or delays the acknowledgement to BlockCypher.
+    
     Returns:
-        JSON response indicating receipt of the webhook
+        JSON response acknowledging receipt of the webhook
     """
+    # Get the raw request data once; it is needed for signature verification
+    request_data = await request.body()
+    
+    # Reject forged deliveries before spending any time decoding them
+    if settings.WEBHOOK_SECRET and not verify_webhook_signature(
+        request_data,
+        request.headers.get("X-Signature", ""),
+        settings.WEBHOOK_SECRET
+    ):
+        return Response(
+            _INVALID_SIGNATURE_BODY,
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            media_type="application/json"
+        )
+    
     try:
-        # Get the raw request data for signature verification
-        request_data = await request.body()
-        
-        # Parse the JSON data
-        request_json = await request.json()
-        
-        # Process the webhook
-        result = BlockcypherWebhookHandler.handle_payment_webhook(
-            request_data,
-            request_json
+        request_json = webhook_payload_adapter.validate_json(request_data)
+    except ValidationError as e:
+        return ORJSONResponse(
+            {"detail": f"Invalid webhook data: {str(e)}"},
+            status_code=status.HTTP_400_BAD_REQUEST
         )
-        
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Invalid webhook data: {str(e)}")
+    
+    tx_hash = request_json.get("hash")
+    redis = get_redis()
+    dedup_key = None
+    # Without a hash there is nothing to tell deliveries apart, so they are not de-duplicated
+    if redis is not None and tx_hash:
+        # BlockCypher retries deliveries; only the first copy of an event is processed.
+        # Confirmation events repeat per block, so the count is part of the key.
+        dedup_key = f"webhook:{tx_hash}:{request_json.get('event')}:{request_json.get('confirmations', 0)}"
+        if not await redis.set(dedup_key, 1, nx=True, ex=WEBHOOK_DEDUP_TTL):
+            return ORJSONResponse({"status": "duplicate"}, status_code=status.HTTP_202_ACCEPTED)
+    
+    # Process the webhook after the response has been sent
+    background_tasks = BackgroundTasks()
+    background_tasks.add_task(_process_webhook, request_data, request_json, dedup_key)
+    
+    return ORJSONResponse(
+        {"status": "accepted"},
+        status_code=status.HTTP_202_ACCEPTED,
+        background=background_tasks
+    )
 
 @router.get("/transactions/{tx_hash}")
 async def get_transaction_status(tx_hash: str):
@@ -55,11 +123,10 @@ async def get_transaction_status(tx_hash: str):
     result = BlockcypherWebhookHandler.get_transaction_status(tx_hash)
     
     if "error" in result:
-        raise HTTPException(status_code=404, detail=result["error"])
+        return Response(_NOT_FOUND_BODY, status_code=status.HTTP_404_NOT_FOUND, media_type="application/json")
     
     return result
 
-@router.post("/simulate")
 async def simulate_payment_webhook(
     event_type: str = "unconfirmed-tx", 
     address: Optional[str] = None,
@@ -68,6 +135,7 @@ async def simulate_payment_webhook(
     """
     Development-only endpoint to simulate a webhook call.
     This is useful for testing without actual blockchain transactions.
+    It is not registered at all when ENV is "production".
     
     Args:
         event_type: Type of event to simulate (unconfirmed-tx, tx-confirmation, double-spend-tx)
@@ -77,11 +145,14 @@ async def simulate_payment_webhook(
     Returns:
         Simulated webhook response
     """
-    # This endpoint should be disabled in production
     result = simulate_webhook(
         event_type=event_type,
         address=address or "simulated_address",
         confirmations=confirmations
     )
     
-    return result 
\ No newline at end of file
+    return ORJSONResponse(result)
+
+
+if settings.ENV != "production":
+    router.add_api_route("/simulate", simulate_payment_webhook, methods=["POST"])
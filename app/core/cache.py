@@ -0,0 +1,25 @@
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+# Shared client, created on startup when REDIS_URL is configured
+redis_client: Optional[Redis] = None
+
+
+async def init_redis() -> None:
+    global redis_client
+    if settings.REDIS_URL:
+        redis_client = Redis.from_url(settings.REDIS_URL)
+
+
+async def close_redis() -> None:
+    global redis_client
+    if redis_client is not None:
+        await redis_client.aclose()
+        redis_client = None
+
+
+def get_redis() -> Optional[Redis]:
+    return redis_client
@@ -1,49 +1,51 @@
+from functools import cached_property, lru_cache
 from typing import Optional
-from pydantic_settings import BaseSettings
-from pydantic import PostgresDsn, field_validator
-import os
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import PostgresDsn, computed_field
 
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(case_sensitive=True, env_file=".env", frozen=True)
+
     PROJECT_NAME: str = "Payment Gateway"
     VERSION: str = "1.0.0"
     API_V1_STR: str = "/api/v1"
+    ENV: str = "development"
+    THREADPOOL_MAX_WORKERS: int = 40
     
     POSTGRES_SERVER: str
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str = "payment_gateway"
     DATABASE_URL: Optional[str] = None
-    SQLALCHEMY_DATABASE_URI: Optional[PostgresDsn] = None
-
-    @field_validator("SQLALCHEMY_DATABASE_URI", mode='before')
-    @classmethod
-    def assemble_db_connection(cls, v: Optional[str], info) -> any:
-        if isinstance(v, str):
-            return v
-        
-        # First check if we have a DATABASE_URL environment variable
-        database_url = os.getenv("DATABASE_URL")
-        if database_url:
-            return database_url
+
+    @computed_field
+    @cached_property
+    def SQLALCHEMY_DATABASE_URI(self) -> str:
+        # Built on first access rather than on every Settings() instantiation
+        if self.DATABASE_URL:
+            return self.DATABASE_URL
             
         # If not, build it from components
-        return PostgresDsn.build(
+        return str(PostgresDsn.build(
             scheme="postgresql",
-            username=info.data.get("POSTGRES_USER"),
-            password=info.data.get("POSTGRES_PASSWORD"),
-            host=info.data.get("POSTGRES_SERVER"),
-            path=f"/{info.data.get('POSTGRES_DB') or ''}",
-        )
+            username=self.POSTGRES_USER,
+            password=self.POSTGRES_PASSWORD,
+            host=self.POSTGRES_SERVER,
+            path=self.POSTGRES_DB or "",
+        ))
 
     BLOCKCYPHER_TOKEN: str
+    WEBHOOK_SECRET: Optional[str] = None
+    REDIS_URL: Optional[str] = None
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
-    class Config:
-        case_sensitive = True
-        env_file = ".env"
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
 
 
-settings = Settings() 
\ No newline at end of file
+settings = get_settings()
@@ -1,13 +1,52 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from sqlalchemy import SmallInteger, create_engine, insert
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.types import TypeDecorator
 
 from app.core.config import settings
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    insertmanyvalues_page_size=10_000,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base()
+class Base(DeclarativeBase):
+    @classmethod
+    def bulk_insert(cls, db: Session, rows: Sequence[Dict[str, Any]]) -> List[Any]:
+        """Batch-insert ``rows`` into this model's table; see :func:`bulk_insert`."""
+        return bulk_insert(db, cls, rows)
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Store a Python Enum as a 2-byte SMALLINT code instead of a Postgres ENUM.
+
+    ``codes`` lists the members in code order (code = position), so the
+    mapping is explicit and never depends on the Enum's definition order.
+    New members must be appended to keep existing codes stable.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[Enum], codes: Tuple[Enum, ...]):
+        super().__init__()
+        self.enum_class = enum_class
+        self.codes = codes
+        self._code_by_member = {member: code for code, member in enumerate(codes)}
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return self._code_by_member[self.enum_class(value)]
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[Enum]:
+        if value is None:
+            return None
+        return self.codes[value]
 
 
 def get_db():
@@ -15,4 +54,26 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close() 
+
+
+def bulk_insert(db: Session, model: Any, rows: Sequence[Dict[str, Any]]) -> List[Any]:
+    """
+    Insert many rows with a single Core executemany instead of one ORM flush per row.
+
+    Args:
+        db: Active session; the caller owns the commit
+        model: Mapped class to insert into (must have an ``id`` primary key)
+        rows: Column-value mappings, one per row
+
+    Returns:
+        The generated primary keys, in the same order as ``rows``
+
+    Rows are sent in pages of ``insertmanyvalues_page_size`` (see ``engine``).
+    Only client-side defaults (the uuid7 key) are expanded per row; timestamps
+    are server defaults, which keeps the batched INSERT path intact.
+    """
+    if not rows:
+        return []
+    result = db.execute(insert(model).returning(model.id, sort_by_parameter_order=True), rows)
+    return list(result.scalars())
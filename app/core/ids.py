@@ -0,0 +1,12 @@
+import os
+import time
+from uuid import UUID
+
+
+def uuid7() -> UUID:
+    # RFC 9562: 48-bit unix ms timestamp, version 7, variant 10, 74 random bits.
+    # Time-ordered so new primary keys land on the right edge of the B-tree.
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return UUID(int=value)
@@ -3,6 +3,11 @@ import sys
 import os
 from pathlib import Path
 
+from app.core.config import settings
+
+# Variable values in tracebacks are costly to render and may leak secrets; keep them to development
+_debug_tracebacks = settings.ENV == "development"
+
 # Create logs directory if it doesn't exist
 log_dir = Path("logs")
 log_dir.mkdir(exist_ok=True)
@@ -15,7 +20,7 @@ logger.add(
     sys.stderr,
     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
     level="INFO",
-    colorize=True
+    colorize=None  # Only emit ANSI codes when stderr is a terminal
 )
 
 # Add file handler with rotation
@@ -26,8 +31,9 @@ logger.add(
     compression="zip",  # Compress rotated files
     format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
     level="DEBUG",
-    backtrace=True,  # Enable backtrace for exceptions
-    diagnose=True,  # Enable diagnose for exceptions
+    enqueue=True,  # Write from a background thread so callers never block on disk I/O
+    backtrace=_debug_tracebacks,  # Extended backtrace for exceptions in development
+    diagnose=_debug_tracebacks,  # Variable values in tracebacks in development
 )
 
 # Export logger for use in other modules
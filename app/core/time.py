@@ -0,0 +1,5 @@
+from datetime import datetime, UTC
+
+
+def utcnow() -> datetime:
+    return datetime.now(UTC)
@@ -1,25 +1,48 @@
-from datetime import datetime, UTC
-from uuid import uuid4
-
-from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, String
+from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Index, Numeric, String, func
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import relationship
 
-from app.core.database import Base
+from app.core.database import Base, SmallIntEnum
+from app.core.ids import uuid7
 from app.domain.payment.payment_schema import PaymentMethod, PaymentStatus
 
+# Persisted SMALLINT codes: position in the tuple. Only ever append.
+PAYMENT_STATUS_CODES = (
+    PaymentStatus.PENDING,
+    PaymentStatus.PROCESSING,
+    PaymentStatus.COMPLETED,
+    PaymentStatus.FAILED,
+    PaymentStatus.CANCELLED,
+)
+PAYMENT_METHOD_CODES = (
+    PaymentMethod.BITCOIN,
+    PaymentMethod.BANK_TRANSFER,
+)
+
 class Payment(Base):
     __tablename__ = "payments"
+    __table_args__ = (
+        # Covers "payments for user X in status Y, newest first" without touching the heap
+        Index(
+            "ix_payments_user_status_created",
+            "user_id",
+            "status",
+            "created_at",
+            postgresql_include=["amount", "currency"],
+        ),
+        CheckConstraint(f"status BETWEEN 0 AND {len(PAYMENT_STATUS_CODES) - 1}", name="ck_payments_status"),
+        CheckConstraint(f"payment_method BETWEEN 0 AND {len(PAYMENT_METHOD_CODES) - 1}", name="ck_payments_payment_method"),
+    )
 
-    id = Column(PGUUID, primary_key=True, default=uuid4)
+    id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(PGUUID, ForeignKey("users.id"))
-    amount = Column(Float)
+    amount = Column(Numeric(20, 8), nullable=False)
     currency = Column(String)
-    status = Column(Enum(PaymentStatus))
-    payment_method = Column(Enum(PaymentMethod))
+    status = Column(SmallIntEnum(PaymentStatus, PAYMENT_STATUS_CODES))
+    payment_method = Column(SmallIntEnum(PaymentMethod, PAYMENT_METHOD_CODES))
     transaction_id = Column(PGUUID, ForeignKey("transactions.id"), nullable=True)
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
-    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC))
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     user = relationship("User", back_populates="payments")
     transaction = relationship("Transaction", back_populates="payment") 
\ No newline at end of file
@@ -1,26 +1,30 @@
-from datetime import datetime, UTC
-from uuid import uuid4
-
-from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, String
+from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Index, Numeric, String, func
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import relationship
 
-from app.core.database import Base
+from app.core.database import Base, SmallIntEnum
+from app.core.ids import uuid7
+from app.domain.payment.payment_model import PAYMENT_METHOD_CODES, PAYMENT_STATUS_CODES
 from app.domain.payment.payment_schema import PaymentMethod, PaymentStatus
 
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index("ix_transactions_wallet_status", "wallet_id", "status"),
+        CheckConstraint(f"status BETWEEN 0 AND {len(PAYMENT_STATUS_CODES) - 1}", name="ck_transactions_status"),
+        CheckConstraint(f"payment_method BETWEEN 0 AND {len(PAYMENT_METHOD_CODES) - 1}", name="ck_transactions_payment_method"),
+    )
 
-    id = Column(PGUUID, primary_key=True, default=uuid4)
+    id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid7)
     wallet_id = Column(PGUUID, ForeignKey("wallets.id"))
-    amount = Column(Float)
+    amount = Column(Numeric(20, 8), nullable=False)
     currency = Column(String)
-    status = Column(Enum(PaymentStatus))
-    payment_method = Column(Enum(PaymentMethod))
-    transaction_hash = Column(String, nullable=True)
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
-    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC))
+    status = Column(SmallIntEnum(PaymentStatus, PAYMENT_STATUS_CODES))
+    payment_method = Column(SmallIntEnum(PaymentMethod, PAYMENT_METHOD_CODES))
+    transaction_hash = Column(String, nullable=True, unique=True, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     wallet = relationship("Wallet", back_populates="transactions")
     payment = relationship("Payment", back_populates="transaction", uselist=False)
@@ -1,19 +1,36 @@
-from datetime import datetime, UTC
+from datetime import datetime
+from decimal import Decimal
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
-from app.domain.payment.payment_schema import PaymentMethod, PaymentStatus
+from app.core.time import utcnow
+from app.domain.payment.payment_schema import (
+    PAYMENT_METHOD_BY_VALUE,
+    PAYMENT_STATUS_BY_VALUE,
+    PaymentMethod,
+    PaymentStatus,
+)
 
 
 class Transaction(BaseModel):
-    id: UUID = Field(default_factory=uuid4)
+    id: Optional[UUID] = None
     wallet_id: UUID
-    amount: float
+    amount: Decimal = Field(max_digits=20, decimal_places=8)
     currency: str
     status: PaymentStatus
     payment_method: PaymentMethod
     transaction_hash: Optional[str] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC)) 
\ No newline at end of file
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow) 
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def _lookup_status(cls, v):
+        return PAYMENT_STATUS_BY_VALUE.get(v, v) if isinstance(v, str) else v
+
+    @field_validator("payment_method", mode="before")
+    @classmethod
+    def _lookup_payment_method(cls, v):
+        return PAYMENT_METHOD_BY_VALUE.get(v, v) if isinstance(v, str) else v
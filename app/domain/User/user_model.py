@@ -1,22 +1,20 @@
-from datetime import datetime, UTC
-from uuid import uuid4
-
-from sqlalchemy import Boolean, Column, DateTime, String
+from sqlalchemy import Boolean, Column, DateTime, String, func
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.core.ids import uuid7
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(PGUUID, primary_key=True, default=uuid4)
+    id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid7)
     email = Column(String, unique=True, index=True)
     hashed_password = Column(String)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
-    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC))
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     wallets = relationship("Wallet", back_populates="user")
     payments = relationship("Payment", back_populates="user")
\ No newline at end of file
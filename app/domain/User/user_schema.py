@@ -1,13 +1,16 @@
-from datetime import datetime, UTC
-from uuid import UUID, uuid4
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.core.time import utcnow
+
 
 class User(BaseModel):
-    id: UUID = Field(default_factory=uuid4)
+    id: Optional[UUID] = None
     email: str
     hashed_password: str
     is_active: bool = True
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC)) 
\ No newline at end of file
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow) 
\ No newline at end of file
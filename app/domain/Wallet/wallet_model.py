@@ -1,23 +1,33 @@
-from datetime import datetime, UTC
-from uuid import uuid4
-
-from sqlalchemy import Column, DateTime, Float, ForeignKey, String
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Numeric, String, cast, func
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.core.ids import uuid7
+from app.infrastructure.providers.blockcypher.utils.conversions import SATOSHI_PER_BTC
 
 class Wallet(Base):
     __tablename__ = "wallets"
 
-    id = Column(PGUUID, primary_key=True, default=uuid4)
+    id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(PGUUID, ForeignKey("users.id"))
     address = Column(String, unique=True, index=True)
     private_key = Column(String)
-    balance = Column(Float, default=0.0)
+    balance = Column(Numeric(20, 8), nullable=False, default=0)
     currency = Column(String, default="BTC")
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
-    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC))
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     user = relationship("User", back_populates="wallets")
-    transactions = relationship("Transaction", back_populates="wallet")
\ No newline at end of file
+    transactions = relationship("Transaction", back_populates="wallet")
+
+    @hybrid_property
+    def balance_sats(self) -> int:
+        # Derived from balance (exact at 8 decimal places) so the two cannot drift apart
+        return int((self.balance or 0) * SATOSHI_PER_BTC)
+
+    @balance_sats.inplace.expression
+    @classmethod
+    def _balance_sats_expression(cls):
+        return cast(cls.balance * SATOSHI_PER_BTC, BigInteger)
@@ -1,15 +1,26 @@
-from datetime import datetime, UTC
-from uuid import UUID, uuid4
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
+
+from app.core.time import utcnow
+from app.infrastructure.providers.blockcypher.utils.conversions import SATOSHI_PER_BTC
 
 
 class Wallet(BaseModel):
-    id: UUID = Field(default_factory=uuid4)
+    id: Optional[UUID] = None
     user_id: UUID
     address: str
     private_key: str
-    balance: float = 0.0
+    balance: Decimal = Field(default=Decimal(0), max_digits=20, decimal_places=8)
     currency: str = "BTC"
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC)) 
\ No newline at end of file
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow) 
+
+    @computed_field
+    @property
+    def balance_sats(self) -> int:
+        # Derived from balance so the two cannot drift apart
+        return int(self.balance * SATOSHI_PER_BTC)
@@ -4,7 +4,8 @@ Service for handling blockchain operations across different cryptocurrency netwo
 This service provides unified access to blockchain functionality through specialized providers.
 """
 
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple, Type, TypeVar
 from ..core.config import settings
 from ..core.logger import logger
 
@@ -13,28 +14,48 @@ from .providers.blockcypher.blockchain import BlockchainService as BCBlockchainS
 from .providers.blockcypher.wallets import WalletManager
 from .providers.blockcypher.transactions import TransactionManager
 from .providers.blockcypher.forwarding import ForwardingManager
+from .providers.blockcypher.common.base import BlockCypherProvider, _build_session
+
+ProviderT = TypeVar("ProviderT", bound=BlockCypherProvider)
 
 class BlockchainService:
     """Service for handling blockchain operations across different networks."""
     
     def __init__(self):
         self.api_token = settings.BLOCKCYPHER_TOKEN
+        self._providers: Dict[Tuple[type, str], BlockCypherProvider] = {}
+        # One connection pool for every provider this service creates
+        self._session = _build_session()
+    
+    def close(self) -> None:
+        """Close the HTTP session shared by this service's providers."""
+        self._session.close()
+    
+    def _get_provider(self, provider_class: Type[ProviderT], network: str) -> ProviderT:
+        """Get the provider of the given class for a network, creating it on first use."""
+        key = (provider_class, network)
+        provider = self._providers.get(key)
+        if provider is None:
+            provider = self._providers.setdefault(
+                key, provider_class(coin_symbol=network, api_token=self.api_token, session=self._session)
+            )
+        return provider
     
     def _get_blockchain_service(self, network: str) -> BCBlockchainService:
         """Get a blockchain service for the specified network."""
-        return BCBlockchainService(coin_symbol=network, api_token=self.api_token)
+        return self._get_provider(BCBlockchainService, network)
     
     def _get_wallet_manager(self, network: str) -> WalletManager:
         """Get a wallet manager for the specified network."""
-        return WalletManager(coin_symbol=network, api_token=self.api_token)
+        return self._get_provider(WalletManager, network)
     
     def _get_transaction_manager(self, network: str) -> TransactionManager:
         """Get a transaction manager for the specified network."""
-        return TransactionManager(coin_symbol=network, api_token=self.api_token)
+        return self._get_provider(TransactionManager, network)
     
     def _get_forwarding_manager(self, network: str) -> ForwardingManager:
         """Get a forwarding manager for the specified network."""
-        return ForwardingManager(coin_symbol=network, api_token=self.api_token)
+        return self._get_provider(ForwardingManager, network)
     
     def get_supported_networks(self) -> List[str]:
         """Get a list of supported cryptocurrency networks."""
@@ -113,6 +134,11 @@ class BlockchainService:
         tx_manager = self._get_transaction_manager(network)
         return tx_manager.get_transaction(tx_hash, include_confidence=True)
     
+    def get_transactions_details_many(self, network: str, tx_hashes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get information for several transactions on the specified network, keyed by hash."""
+        tx_manager = self._get_transaction_manager(network)
+        return tx_manager.get_transactions_many(tx_hashes)
+    
     # Blockchain operations
     
     def get_latest_block_height(self, network: str) -> int:
@@ -206,3 +232,8 @@ class BlockchainService:
                 confirmations=confirmations
             )
 
+
+@lru_cache(maxsize=1)
+def get_blockchain_service() -> BlockchainService:
+    """Get the process-wide BlockchainService, so its providers are built once and shared."""
+    return BlockchainService()
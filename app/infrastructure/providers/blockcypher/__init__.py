@@ -15,19 +15,24 @@ The module is structured into separate components:
 
 # Import main components for easy access
 from app.infrastructure.providers.blockcypher.common.base import BlockCypherProvider
-from app.infrastructure.providers.blockcypher.wallets import WalletManager
+from app.infrastructure.providers.blockcypher.common.exceptions import BlockCypherError
+from app.infrastructure.providers.blockcypher.wallets import AsyncWalletManager, WalletManager
 from app.infrastructure.providers.blockcypher.transactions import TransactionManager, TransactionValidator
-from app.infrastructure.providers.blockcypher.forwarding import ForwardingManager
-from app.infrastructure.providers.blockcypher.blockchain import BlockchainService
+from app.infrastructure.providers.blockcypher.forwarding import AsyncForwardingManager, ForwardingManager
+from app.infrastructure.providers.blockcypher.blockchain import AsyncBlockchainService, BlockchainService
 from app.infrastructure.providers.blockcypher.webhooks import BlockcypherWebhookHandler, simulate_webhook
 
 __all__ = [
     'BlockCypherProvider',
+    'BlockCypherError',
     'WalletManager',
+    'AsyncWalletManager',
     'TransactionManager',
     'TransactionValidator',
     'ForwardingManager',
+    'AsyncForwardingManager',
     'BlockchainService',
+    'AsyncBlockchainService',
     'BlockcypherWebhookHandler',
     'simulate_webhook',
 ]
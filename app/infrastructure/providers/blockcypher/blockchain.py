@@ -5,36 +5,58 @@ This module provides access to blockchain-specific features like blocks and netw
 Use specialized manager classes for transactions, wallets, and other features.
 """
 
-from typing import Dict, Any, Optional, List
-import blockcypher
-import os
+from functools import lru_cache
+from typing import Dict, Any, Final, Optional, List, Sequence
 import warnings
+import httpx
+import requests
+from requests.exceptions import RequestException
 
+from app.infrastructure.providers.blockcypher.common.async_base import AsyncBlockCypherProvider
 from app.infrastructure.providers.blockcypher.common.base import BlockCypherProvider
+from app.infrastructure.providers.blockcypher.common.exceptions import BlockCypherError
+from app.infrastructure.providers.blockcypher.common.projections import project_block
+from app.infrastructure.providers.blockcypher.common.rate_limit import AsyncRateLimiter
 from app.infrastructure.providers.blockcypher.common.types import CoinSymbol
 from app.infrastructure.providers.blockcypher.wallets.manager import WalletManager
 
+_DEPRECATION_MESSAGES: Final = {
+    "get_address_balance": "get_address_balance() is deprecated. Use WalletManager.get_wallet_balance() instead.",
+    "get_address_details": "get_address_details() is deprecated. Use WalletManager.get_wallet_details() instead.",
+}
+
+@lru_cache(maxsize=None)
+def _warn_deprecated(method_name: str) -> None:
+    """Emit the deprecation warning for a method once per process rather than on every call."""
+    warnings.warn(_DEPRECATION_MESSAGES[method_name], DeprecationWarning, stacklevel=3)
+
 class BlockchainService(BlockCypherProvider):
     """
     High-level service for interacting with blockchain data through BlockCypher API.
     
     This class provides access to blockchain data like blocks and network information.
     
+    The latest block height and network information (including fee estimates)
+    are read from the shared network parameters cache (NETWORK_PARAMS_TTL
+    seconds); call refresh() to drop it.
+    
     Note:
         - For transaction operations, use TransactionManager instead.
         - For wallet operations, use WalletManager instead.
         - For forwarding and webhook operations, use ForwardingManager instead.
     """
     
-    def __init__(self, coin_symbol: CoinSymbol = 'btc-testnet', api_token: Optional[str] = None):
+    def __init__(self, coin_symbol: CoinSymbol = 'btc-testnet', api_token: Optional[str] = None,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the blockchain service.
         
         Args:
             coin_symbol: Cryptocurrency network symbol (default: btc-testnet)
             api_token: BlockCypher API token (default: None, reads from environment)
+            session: Optional HTTP session (default: the per-thread keep-alive session)
         """
-        super().__init__(coin_symbol=coin_symbol, api_token=api_token)
+        super().__init__(coin_symbol=coin_symbol, api_token=api_token, session=session)
         self._wallet_manager = None
     
     @property
@@ -48,7 +70,8 @@ class BlockchainService(BlockCypherProvider):
         if self._wallet_manager is None:
             self._wallet_manager = WalletManager(
                 coin_symbol=self.coin_symbol,
-                api_token=self.api_token
+                api_token=self.api_token,
+                session=self._session
             )
         return self._wallet_manager
     
@@ -60,37 +83,45 @@ class BlockchainService(BlockCypherProvider):
             Block height as an integer
         """
         try:
-            return blockcypher.get_latest_block_height(coin_symbol=self.coin_symbol)
+            return self.get_network_parameters()["height"]
         except Exception as e:
-            raise Exception(f"Failed to get latest block height: {str(e)}")
+            raise BlockCypherError("Failed to get latest block height") from e
     
-    def get_block_details(self, block_height: int) -> Dict[str, Any]:
+    def get_block_details(self, block_height: int, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
         """
         Get detailed information about a specific block.
         
         Args:
             block_height: The height of the block to retrieve
+            fields: Optional block fields to return (default: all summary fields).
+                Leaving out "txids" avoids copying the block's transaction list.
             
         Returns:
             Dictionary with block details
         """
         try:
-            details = blockcypher.get_block_details(block_height, coin_symbol=self.coin_symbol)
-            return {
-                "hash": details.get("hash"),
-                "height": details.get("height"),
-                "time": details.get("time"),
-                "n_tx": details.get("n_tx"),
-                "total": details.get("total"),
-                "fees": details.get("fees"),
-                "size": details.get("size"),
-                "ver": details.get("ver"),
-                "prev_block": details.get("prev_block"),
-                "mrkl_root": details.get("mrkl_root"),
-                "txids": details.get("txids", [])
-            }
+            details = self.make_request('GET', f"blocks/{block_height}")
+            return project_block(details, fields)
         except Exception as e:
-            raise Exception(f"Failed to get block details: {str(e)}")
+            raise BlockCypherError("Failed to get block details") from e
+    
+    def get_block_details_many(self, block_heights: List[int],
+                               fields: Optional[Sequence[str]] = None) -> Dict[int, Dict[str, Any]]:
+        """
+        Get detailed information about several blocks using batched requests.
+        
+        Args:
+            block_heights: Heights of the blocks to retrieve
+            fields: Optional block fields to return (default: all summary fields)
+            
+        Returns:
+            Dictionary mapping each block height to its details
+        """
+        try:
+            blocks = self.make_batch_request('blocks', block_heights)
+            return {block.get("height"): project_block(block, fields) for block in blocks}
+        except (RequestException, KeyError, TypeError, AttributeError) as e:
+            raise BlockCypherError("Failed to get block details") from e
     
     def get_block_overview(self, block_height: int) -> Dict[str, Any]:
         """
@@ -103,9 +134,9 @@ class BlockchainService(BlockCypherProvider):
             Dictionary with block overview
         """
         try:
-            return blockcypher.get_block_overview(block_height, coin_symbol=self.coin_symbol)
+            return self.make_request('GET', f"blocks/{block_height}")
         except Exception as e:
-            raise Exception(f"Failed to get block overview: {str(e)}")
+            raise BlockCypherError("Failed to get block overview") from e
     
     def get_network_info(self) -> Dict[str, Any]:
         """
@@ -115,9 +146,9 @@ class BlockchainService(BlockCypherProvider):
             Dictionary with network information
         """
         try:
-            return blockcypher.get_blockchain_overview(coin_symbol=self.coin_symbol)
+            return self.get_network_parameters()
         except Exception as e:
-            raise Exception(f"Failed to get network information: {str(e)}")
+            raise BlockCypherError("Failed to get network information") from e
 
     def get_fee_estimates(self) -> Dict[str, int]:
         """
@@ -126,15 +157,19 @@ class BlockchainService(BlockCypherProvider):
         Returns:
             Dictionary with fee estimates in satoshis per kilobyte
         """
-        try:
-            info = blockcypher.get_blockchain_overview(coin_symbol=self.coin_symbol)
-            return {
-                "high_fee_per_kb": info.get("high_fee_per_kb", 0),
-                "medium_fee_per_kb": info.get("medium_fee_per_kb", 0),
-                "low_fee_per_kb": info.get("low_fee_per_kb", 0)
-            }
-        except Exception as e:
-            raise Exception(f"Failed to get fee estimates: {str(e)}")
+        # Fee estimates are part of the (cached) network parameters
+        info = self.get_network_info()
+        return {
+            "high_fee_per_kb": info.get("high_fee_per_kb", 0),
+            "medium_fee_per_kb": info.get("medium_fee_per_kb", 0),
+            "low_fee_per_kb": info.get("low_fee_per_kb", 0)
+        }
+    
+    def refresh(self) -> None:
+        """
+        Drop the cached block height and network information so the next call hits the API.
+        """
+        self._network_params_cache.pop(self.coin_symbol)
     
     def get_address_balance(self, address: str) -> float:
         """
@@ -149,11 +184,7 @@ class BlockchainService(BlockCypherProvider):
         Returns:
             Balance in the native coin unit
         """
-        warnings.warn(
-            "get_address_balance() is deprecated. Use WalletManager.get_wallet_balance() instead.",
-            DeprecationWarning,
-            stacklevel=2
-        )
+        _warn_deprecated("get_address_balance")
         return self.wallet_manager.get_wallet_balance(address)
     
     def get_address_details(self, address: str) -> Dict[str, Any]:
@@ -169,11 +200,124 @@ class BlockchainService(BlockCypherProvider):
         Returns:
             Dictionary with address details
         """
-        warnings.warn(
-            "get_address_details() is deprecated. Use WalletManager.get_wallet_details() instead.",
-            DeprecationWarning,
-            stacklevel=2
-        )
+        _warn_deprecated("get_address_details")
         return self.wallet_manager.get_wallet_details(address)
 
 
+class AsyncBlockchainService(AsyncBlockCypherProvider):
+    """
+    Asynchronous counterpart of BlockchainService for use from coroutines.
+    
+    Requests are awaited on a pooled httpx.AsyncClient instead of occupying a
+    worker thread, and the same shared network parameters cache applies.
+    BlockchainService remains the synchronous API.
+    """
+    
+    def __init__(self, coin_symbol: CoinSymbol = 'btc-testnet', api_token: Optional[str] = None,
+                 client: Optional[httpx.AsyncClient] = None,
+                 rate_limiter: Optional[AsyncRateLimiter] = None):
+        """
+        Initialize the async blockchain service.
+        
+        Args:
+            coin_symbol: Cryptocurrency network symbol (default: btc-testnet)
+            api_token: BlockCypher API token (default: None, reads from environment)
+            client: Optional shared httpx.AsyncClient
+            rate_limiter: Optional limiter (default: the one shared by this API token)
+        """
+        super().__init__(coin_symbol=coin_symbol, api_token=api_token, client=client,
+                         rate_limiter=rate_limiter)
+    
+    async def get_latest_block_height(self) -> int:
+        """
+        Get the latest block height for this blockchain.
+        
+        Returns:
+            Block height as an integer
+        """
+        try:
+            return (await self.get_network_parameters())["height"]
+        except Exception as e:
+            raise BlockCypherError("Failed to get latest block height") from e
+    
+    async def get_block_details(self, block_height: int, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Get detailed information about a specific block.
+        
+        Args:
+            block_height: The height of the block to retrieve
+            fields: Optional block fields to return (default: all summary fields)
+            
+        Returns:
+            Dictionary with block details
+        """
+        try:
+            details = await self.make_request('GET', f"blocks/{block_height}")
+            return project_block(details, fields)
+        except Exception as e:
+            raise BlockCypherError("Failed to get block details") from e
+    
+    async def get_block_details_many(self, block_heights: List[int],
+                                     fields: Optional[Sequence[str]] = None) -> Dict[int, Dict[str, Any]]:
+        """
+        Get detailed information about several blocks using batched requests.
+        
+        Args:
+            block_heights: Heights of the blocks to retrieve
+            fields: Optional block fields to return (default: all summary fields)
+            
+        Returns:
+            Dictionary mapping each block height to its details
+        """
+        try:
+            blocks = await self.make_batch_request('blocks', block_heights)
+            return {block.get("height"): project_block(block, fields) for block in blocks}
+        except (httpx.HTTPError, KeyError, TypeError, AttributeError) as e:
+            raise BlockCypherError("Failed to get block details") from e
+    
+    async def get_block_overview(self, block_height: int) -> Dict[str, Any]:
+        """
+        Get a summarized overview of a specific block.
+        
+        Args:
+            block_height: The height of the block to retrieve
+            
+        Returns:
+            Dictionary with block overview
+        """
+        try:
+            return await self.make_request('GET', f"blocks/{block_height}")
+        except Exception as e:
+            raise BlockCypherError("Failed to get block overview") from e
+    
+    async def get_network_info(self) -> Dict[str, Any]:
+        """
+        Get information about the current network.
+        
+        Returns:
+            Dictionary with network information
+        """
+        try:
+            return await self.get_network_parameters()
+        except Exception as e:
+            raise BlockCypherError("Failed to get network information") from e
+    
+    async def get_fee_estimates(self) -> Dict[str, int]:
+        """
+        Get fee estimates for different priority levels.
+        
+        Returns:
+            Dictionary with fee estimates in satoshis per kilobyte
+        """
+        info = await self.get_network_info()
+        return {
+            "high_fee_per_kb": info.get("high_fee_per_kb", 0),
+            "medium_fee_per_kb": info.get("medium_fee_per_kb", 0),
+            "low_fee_per_kb": info.get("low_fee_per_kb", 0)
+        }
+    
+    def refresh(self) -> None:
+        """
+        Drop the cached block height and network information so the next call hits the API.
+        """
+        self._network_params_cache.pop(self.coin_symbol)
@@ -5,7 +5,38 @@ This package contains shared types, constants, and base classes used by
 the BlockCypher provider implementation.
 """
 
-from app.infrastructure.providers.blockcypher.common.types import *
+from app.infrastructure.providers.blockcypher.common.types import (
+    CoinSymbol, TxConfirmationLevel, TransactionStatus, WebhookEventType, VALID_WEBHOOK_EVENTS, ScriptType,
+    Address, TransactionHash, Satoshi, BTCAmount, AddressInfo, TransactionInfo, WebhookInfo, WalletInfo
+)
 from app.infrastructure.providers.blockcypher.common.base import BlockCypherProvider
+from app.infrastructure.providers.blockcypher.common.async_base import AsyncBlockCypherProvider
+from app.infrastructure.providers.blockcypher.common.exceptions import (
+    BlockCypherError, CircuitOpenError, ForwardingError, CreateForwardingAddressError,
+    DeleteForwardingAddressError, WebhookError
+)
 
-__all__ = ['BlockCypherProvider'] 
\ No newline at end of file
+__all__ = [
+    'BlockCypherProvider',
+    'AsyncBlockCypherProvider',
+    'BlockCypherError',
+    'CircuitOpenError',
+    'ForwardingError',
+    'CreateForwardingAddressError',
+    'DeleteForwardingAddressError',
+    'WebhookError',
+    'CoinSymbol',
+    'TxConfirmationLevel',
+    'TransactionStatus',
+    'WebhookEventType',
+    'VALID_WEBHOOK_EVENTS',
+    'ScriptType',
+    'Address',
+    'TransactionHash',
+    'Satoshi',
+    'BTCAmount',
+    'AddressInfo',
+    'TransactionInfo',
+    'WebhookInfo',
+    'WalletInfo',
+]
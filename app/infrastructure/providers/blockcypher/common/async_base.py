@@ -0,0 +1,198 @@
+"""
+Asynchronous base classes for BlockCypher API integration.
+
+This module contains the async counterpart of BlockCypherProvider, for use from
+coroutines (e.g. FastAPI endpoints) without blocking the event loop.
+"""
+
+import asyncio
+import httpx
+import orjson
+import os
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Dict, Any, Final, List, Optional, Sequence, Union
+
+from app.infrastructure.providers.blockcypher.common.base import DEFAULT_HEADERS, JSON_HEADERS, BlockCypherProvider
+from app.infrastructure.providers.blockcypher.common.rate_limit import AsyncRateLimiter
+
+# Client settings used when no client is injected
+REQUEST_TIMEOUT: Final[float] = 10.0
+CLIENT_LIMITS: Final[httpx.Limits] = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# Multiplex concurrent requests over one connection when the h2 package (httpx[http2]) is installed
+HTTP2_ENABLED: Final[bool] = find_spec("h2") is not None
+
+@lru_cache(maxsize=None)
+def _rate_limiter(api_token: str) -> AsyncRateLimiter:
+    """
+    Get the limiter shared by every async provider using ``api_token``.
+    
+    BLOCKCYPHER_RATE (requests per second; BlockCypher's free tier allows 3) is
+    read when the token's limiter is first needed, not at import.
+    """
+    return AsyncRateLimiter(max_rate=float(os.getenv("BLOCKCYPHER_RATE", "3")), time_period=1.0)
+
+class AsyncBlockCypherProvider(BlockCypherProvider):
+    """
+    Base class for asynchronous BlockCypher API providers.
+
+    Shares token handling, URL construction and network mapping with
+    BlockCypherProvider, but performs requests with an httpx.AsyncClient.
+    The client is created on first use and kept for the provider's lifetime so
+    connections are reused, over HTTP/2 when h2 is installed; call aclose()
+    (or use ``async with``) when done.
+
+    Requests are paced by a rate limiter shared by all providers with the same
+    API token (BLOCKCYPHER_RATE requests per second), and at most
+    MAX_CONCURRENCY requests per provider are in flight at once.
+    """
+
+    # Maximum number of in-flight requests per provider
+    MAX_CONCURRENCY = 16
+
+    def __init__(self, coin_symbol: str = 'btc-testnet', api_token: Optional[str] = None,
+                 client: Optional[httpx.AsyncClient] = None,
+                 rate_limiter: Optional[AsyncRateLimiter] = None):
+        """
+        Initialize the async BlockCypher provider.
+
+        Args:
+            coin_symbol: The cryptocurrency to use (default: btc-testnet)
+            api_token: Optional API token override. If not provided, will use BLOCKCYPHER_API_TOKEN env var
+            client: Optional shared client. An injected client is not closed by aclose()
+            rate_limiter: Optional limiter (default: the one shared by this API token)
+        """
+        super().__init__(coin_symbol=coin_symbol, api_token=api_token)
+        self._client = client
+        self._owns_client = client is None
+        self._rate_limiter = rate_limiter or _rate_limiter(self.api_token)
+        self._concurrency = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Get or create the HTTP client used by this provider.
+
+        Returns:
+            httpx.AsyncClient instance
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_ENABLED,
+                timeout=REQUEST_TIMEOUT,
+                limits=CLIENT_LIMITS,
+                headers=DEFAULT_HEADERS
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Close the HTTP client if this provider created it.
+        """
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncBlockCypherProvider":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def make_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                           data: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        """
+        Make a request to the BlockCypher API.
+
+        Args:
+            method: HTTP method (GET, POST, DELETE, etc.)
+            endpoint: API endpoint path
+            params: Optional query parameters
+            data: Optional request body data
+            **kwargs: Additional parameters to pass to httpx
+
+        Returns:
+            API response as dictionary
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        request_params = {**self.default_params, **params} if params else self.default_params
+
+        # Encode the body with orjson rather than letting httpx use the stdlib encoder
+        if data is not None:
+            kwargs['content'] = orjson.dumps(data)
+            kwargs['headers'] = {**JSON_HEADERS, **kwargs.get('headers', {})}
+
+        async with self._concurrency, self._rate_limiter:
+            response = await self.client.request(
+                method,
+                self.get_url(endpoint),
+                params=request_params,
+                **kwargs
+            )
+
+        # Raise an exception for 4XX and 5XX responses
+        response.raise_for_status()
+
+        # Endpoints such as DELETE answer 204 with no body
+        if not response.content:
+            return {}
+
+        # Parse the raw bytes directly; much faster than response.json() on large block payloads
+        return orjson.loads(response.content)
+
+    async def make_batch_request(self, endpoint: str, identifiers: Sequence[Union[str, int]],
+                                 params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch several resources of one kind using BlockCypher's batch syntax,
+        one HTTP request per MAX_BATCH_SIZE identifiers, all in flight at once.
+
+        Args:
+            endpoint: Resource endpoint the identifiers are appended to (e.g. 'blocks', 'addrs')
+            identifiers: Block heights/hashes, addresses, etc. to fetch
+            params: Optional query parameters applied to every batch
+
+        Returns:
+            List of resource objects, not necessarily in request order
+
+        Raises:
+            httpx.HTTPError: If a request fails
+        """
+        batches = [
+            identifiers[start:start + self.MAX_BATCH_SIZE]
+            for start in range(0, len(identifiers), self.MAX_BATCH_SIZE)
+        ]
+
+        # Batches are independent, so request them concurrently
+        responses = await asyncio.gather(*(
+            self.make_request('GET', f"{endpoint}/{';'.join(map(str, batch))}", params=params)
+            for batch in batches
+        ))
+
+        results = []
+        for response in responses:
+            # A batch of one comes back as a single object rather than a list
+            if isinstance(response, list):
+                results.extend(response)
+            else:
+                results.append(response)
+        return results
+
+    async def get_network_parameters(self) -> Dict[str, Any]:
+        """
+        Get information about the current network/blockchain.
+
+        Responses share the per-coin cache used by the synchronous providers.
+
+        Returns:
+            Dictionary with network parameters
+        """
+        params = self._network_params_cache.get(self.coin_symbol)
+        if params is None:
+            params = await self.make_request('GET', '')
+            self._network_params_cache.set(self.coin_symbol, params)
+
+        # Hand out a copy so callers can't modify the cached entry
+        return dict(params)
@@ -4,9 +4,133 @@ Base classes for BlockCypher API integration.
 This module contains the base provider class that all BlockCypher service classes inherit from.
 """
 
+import orjson
 import os
 import requests
-from typing import Dict, Any, Tuple, Optional
+import threading
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from requests.adapters import HTTPAdapter
+from requests.exceptions import InvalidJSONError, RequestException
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Final, Iterable, List, Mapping, Tuple, Optional, Sequence, TypeVar, Union
+from urllib.parse import urlencode
+from urllib3.util.retry import Retry
+
+from app.infrastructure.providers.blockcypher.common.cache import TTLCache
+from app.infrastructure.providers.blockcypher.common.circuit_breaker import CircuitBreaker
+from app.infrastructure.providers.blockcypher.utils.conversions import SATOSHI_PER_BTC
+
+# Connection pool sizing for each HTTP session
+POOL_CONNECTIONS: Final[int] = 16
+POOL_MAXSIZE: Final[int] = 32
+
+# Seconds to wait for a connection and then for each read, so a stalled socket
+# fails (and counts against the circuit breaker) instead of hanging a thread
+CONNECT_TIMEOUT: Final[float] = 2.0
+READ_TIMEOUT: Final[float] = 10.0
+
+# Headers sent with every request. requests already defaults to keep-alive and
+# "gzip, deflate"; they are spelled out so the intent does not hinge on library defaults.
+DEFAULT_HEADERS: Final[Dict[str, str]] = {
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'User-Agent': 'payments/blockcypher-client',
+}
+
+# Content type of JSON request bodies, which are encoded with orjson
+JSON_HEADERS: Final[Dict[str, str]] = {'Content-Type': 'application/json'}
+
+
+# Retry policy for transient failures: connection errors, rate limiting and gateway
+# errors are retried with exponential backoff (honouring Retry-After), capped at
+# 4 s and jittered so clients that failed together do not retry in lockstep. POST
+# is left out because creating wallets, webhooks or forwards is not idempotent.
+# Once retries run out the last response is returned so raise_for_status()
+# reports its status. urllib3 logs each retry at DEBUG level.
+_RETRY: Final[Retry] = Retry(
+    total=5,
+    backoff_factor=0.5,
+    backoff_max=4.0,
+    backoff_jitter=0.2,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset(['GET', 'PUT', 'DELETE', 'HEAD', 'OPTIONS']),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+
+def _build_session() -> requests.Session:
+    """
+    Create an HTTP session for BlockCypher calls.
+    
+    Keeping a session alive means connections (and their TLS handshakes) are
+    reused across calls instead of being set up for every request.
+    
+    Returns:
+        Session with a pooled, retrying HTTPS adapter mounted
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=_RETRY
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Bare urllib3 pool for hot polling paths and the optional urllib3 transport (see
+# _pool_request). It is thread-safe, so a single pool is shared by every thread.
+_POOL: Final[urllib3.PoolManager] = urllib3.PoolManager(
+    num_pools=POOL_CONNECTIONS,
+    maxsize=POOL_MAXSIZE,
+    headers=DEFAULT_HEADERS,
+    retries=_RETRY,
+    timeout=urllib3.Timeout(connect=CONNECT_TIMEOUT, read=READ_TIMEOUT)
+)
+
+# Methods whose fields urllib3 encodes into the query string rather than the body
+_QUERY_METHODS: Final[frozenset] = frozenset(['GET', 'HEAD', 'DELETE', 'OPTIONS'])
+
+# Default sessions, one per thread so concurrent threads do not contend on a
+# single connection pool's lock
+_local = threading.local()
+
+
+def _thread_session() -> requests.Session:
+    """
+    Get the calling thread's default session, creating it on first use.
+    
+    Returns:
+        Session shared by every provider used from this thread
+    """
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = _local.session = _build_session()
+    return session
+
+
+# Mapping of coin_symbol to (coin, chain) tuple used in BlockCypher API URLs
+_COIN_MAP: Final[Mapping[str, Tuple[str, str]]] = MappingProxyType({
+    'btc': ('btc', 'main'),
+    'btc-testnet': ('btc', 'test3'),
+    'ltc': ('ltc', 'main'),
+    'doge': ('doge', 'main'),
+    'dash': ('dash', 'main'),
+    'bcy': ('bcy', 'test')
+})
+
+# API base URL per coin symbol
+_BASE_URLS: Final[Mapping[str, str]] = MappingProxyType({
+    symbol: f"https://api.blockcypher.com/v1/{coin}/{chain}"
+    for symbol, (coin, chain) in _COIN_MAP.items()
+})
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
 
 class BlockCypherProvider:
     """
@@ -16,17 +140,35 @@ class BlockCypherProvider:
     and network parameter mapping.
     """
     
-    # Mapping of coin_symbol to (coin, chain) tuple used in BlockCypher API URL
-    COIN_SYMBOL_MAPPING = {
-        'btc': ('btc', 'main'),
-        'btc-testnet': ('btc', 'test3'),
-        'ltc': ('ltc', 'main'),
-        'doge': ('doge', 'main'),
-        'dash': ('dash', 'main'),
-        'bcy': ('bcy', 'test')
-    }
+    # Mapping of coin_symbol to (coin, chain) tuple used in BlockCypher API URL (read-only)
+    COIN_SYMBOL_MAPPING: Final[Mapping[str, Tuple[str, str]]] = _COIN_MAP
     
-    def __init__(self, coin_symbol: str = 'btc-testnet', api_token: Optional[str] = None):
+    # API base URL per coin symbol (read-only)
+    _BASE_URLS: Final[Mapping[str, str]] = _BASE_URLS
+    
+    # Maximum number of semicolon-separated identifiers BlockCypher accepts in one batch call
+    MAX_BATCH_SIZE = 100
+    
+    # Network parameters change slowly, so they are cached per coin for
+    # NETWORK_PARAMS_TTL seconds and shared by every provider instance
+    NETWORK_PARAMS_TTL = 60
+    _network_params_cache = TTLCache(ttl=NETWORK_PARAMS_TTL, maxsize=16)
+    
+    # Consecutive failures (transport errors, 5XX) on one resource that open its
+    # circuit breaker, and how long calls then fail fast before a probe is allowed
+    BREAKER_FAILURE_THRESHOLD = 5
+    BREAKER_RESET_TIMEOUT = 30.0
+    _circuit_breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+    
+    # Conversion multiplier for satoshis to main units (1 BTC = 100,000,000 satoshis)
+    SATOSHI: Final[int] = SATOSHI_PER_BTC
+    satoshi_multiplier = SATOSHI  # Kept for compatibility; no longer set per instance
+    
+    # Fixed instance layout; subclasses without __slots__ still get a __dict__
+    __slots__ = ('_session', 'api_token', 'base_url', 'coin_symbol', '_base_url_slash', 'default_params')
+    
+    def __init__(self, coin_symbol: str = 'btc-testnet', api_token: Optional[str] = None,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the BlockCypher provider.
         
@@ -34,23 +176,73 @@ class BlockCypherProvider:
             coin_symbol: The cryptocurrency to use (default: btc-testnet)
                 Options: btc (Bitcoin), btc-testnet, ltc (Litecoin), doge (Dogecoin), etc.
             api_token: Optional API token override. If not provided, will use BLOCKCYPHER_API_TOKEN env var
+            session: Optional HTTP session to use instead of the per-thread keep-alive session
         """
-        self.api_token = api_token or os.getenv("BLOCKCYPHER_API_TOKEN")
+        self._session = session
+        self.api_token = api_token or self._default_token()
         if not self.api_token:
             raise ValueError("BlockCypher API token not provided and BLOCKCYPHER_API_TOKEN is not set")
         
-        if coin_symbol not in self.COIN_SYMBOL_MAPPING:
-            raise ValueError(f"Invalid coin symbol: {coin_symbol}. Valid options: {list(self.COIN_SYMBOL_MAPPING.keys())}")
+        try:
+            self.base_url = self._BASE_URLS[coin_symbol]
+        except KeyError:
+            raise ValueError(f"Invalid coin symbol: {coin_symbol}. Valid options: {list(self.COIN_SYMBOL_MAPPING.keys())}") from None
         
         self.coin_symbol = coin_symbol
-        coin, chain = self.COIN_SYMBOL_MAPPING[coin_symbol]
-        self.base_url = f"https://api.blockcypher.com/v1/{coin}/{chain}"
+        self._base_url_slash = self.base_url + '/'
         
         # Set default parameters used in all requests
         self.default_params = {'token': self.api_token}
+    
+    @staticmethod
+    @cache
+    def _default_token() -> Optional[str]:
+        """
+        Get the default API token from BLOCKCYPHER_API_TOKEN.
         
-        # Set up the conversion multiplier for satoshis to main units
-        self.satoshi_multiplier = 100000000  # 1 BTC = 100,000,000 satoshis
+        The environment is read once, on first use, rather than on every provider
+        construction; call ``_default_token.cache_clear()`` after changing it.
+        
+        Returns:
+            The token, or None if the variable is not set
+        """
+        return os.getenv("BLOCKCYPHER_API_TOKEN")
+    
+    @staticmethod
+    @cache
+    def _urllib3_transport() -> bool:
+        """
+        Whether calls without an injected session go straight through urllib3.
+        
+        Enabled with BLOCKCYPHER_HTTP_TRANSPORT=urllib3 (requests is the default).
+        Read once, on first use; call ``_urllib3_transport.cache_clear()`` after changing it.
+        """
+        return os.getenv("BLOCKCYPHER_HTTP_TRANSPORT", "requests") == "urllib3"
+    
+    @property
+    def session(self) -> requests.Session:
+        """
+        Get the HTTP session used by this provider.
+        
+        Returns:
+            The injected session, or else the calling thread's default session
+        """
+        return self._session if self._session is not None else _thread_session()
+    
+    def close(self) -> None:
+        """
+        Close the session given to this provider.
+        
+        The per-thread default sessions are left open, since other providers use them.
+        """
+        if self._session is not None:
+            self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def get_url(self, endpoint: str) -> str:
         """
@@ -63,10 +255,7 @@ class BlockCypherProvider:
             Full API URL
         """
         # Ensure endpoint does not start with slash to avoid double slashes
-        if endpoint.startswith('/'):
-            endpoint = endpoint[1:]
-        
-        return f"{self.base_url}/{endpoint}"
+        return self._base_url_slash + (endpoint[1:] if endpoint.startswith('/') else endpoint)
     
     def make_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, 
                     data: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
@@ -86,33 +275,259 @@ class BlockCypherProvider:
         Raises:
             requests.exceptions.RequestException: If the request fails
         """
+        # Injected sessions and requests-specific options always go through requests
+        if self._session is None and self._urllib3_transport() and not kwargs:
+            return self._pool_request(method, endpoint, params=params, data=data)
+        
         url = self.get_url(endpoint)
         
-        # Merge default params with provided params
-        request_params = {**self.default_params}
-        if params:
-            request_params.update(params)
+        # Merge default params with provided params (the defaults are passed as-is when there are none)
+        request_params = {**self.default_params, **params} if params else self.default_params
         
-        # Make the request
-        response = requests.request(
+        # Encode the body with orjson rather than letting requests use the stdlib encoder
+        if data is not None:
+            kwargs['data'] = orjson.dumps(data)
+            kwargs['headers'] = {**JSON_HEADERS, **kwargs.get('headers', {})}
+        kwargs.setdefault('timeout', (CONNECT_TIMEOUT, READ_TIMEOUT))
+        
+        # Make the request over the (by default per-thread) keep-alive session
+        response = self._send(endpoint, lambda: self.session.request(
             method=method,
             url=url,
             params=request_params,
-            json=data,
             **kwargs
-        )
+        ))
         
-        # Raise an exception for 4XX and 5XX responses
-        response.raise_for_status()
+        return self._parse_response(response)
+    
+    def _get_json(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        GET a read-only endpoint used by frequently polled lookups.
+        
+        With the urllib3 transport enabled and no session injected, the call skips
+        the requests layer (prepared requests, hooks, cookie merging); otherwise it
+        goes through make_request, so an injected session is always honoured.
+        Retries and errors behave the same either way.
         
-        # Parse and return the JSON response
-        return response.json()
+        Args:
+            endpoint: API endpoint path
+            params: Optional query parameters
+            
+        Returns:
+            Parsed API response
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        if self._session is None and self._urllib3_transport():
+            return self._pool_request('GET', endpoint, params=params)
+        return self.make_request('GET', endpoint, params=params)
+    
+    def _pool_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                      data: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Send a request through the shared urllib3 pool rather than a requests session.
+        
+        Args:
+            method: HTTP method (GET, POST, DELETE, etc.)
+            endpoint: API endpoint path
+            params: Optional query parameters
+            data: Optional request body data, encoded with orjson
+            
+        Returns:
+            Parsed API response
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        url = self.get_url(endpoint)
+        request_params = {**self.default_params, **params} if params else self.default_params
+        
+        def send() -> requests.Response:
+            try:
+                if data is None and method in _QUERY_METHODS:
+                    raw = _POOL.request(method, url, fields=request_params)
+                else:
+                    # urllib3 would put fields in the body for POST/PUT, so the query is built here
+                    raw = _POOL.request(
+                        method,
+                        f"{url}?{urlencode(request_params)}",
+                        body=None if data is None else orjson.dumps(data),
+                        headers={**DEFAULT_HEADERS, **JSON_HEADERS}
+                    )
+            except urllib3.exceptions.HTTPError as e:
+                raise requests.exceptions.ConnectionError(f"{method} {url} failed: {e}") from e
+            
+            # Wrap the result so status and body handling match the session path
+            response = requests.Response()
+            response.status_code = raw.status
+            response._content = raw.data
+            response.url = url
+            return response
+        
+        return self._parse_response(self._send(endpoint, send))
+    
+    def _circuit_breaker(self, endpoint: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker guarding an endpoint's resource (e.g. 'hooks', 'payments').
+        
+        Breakers are kept per network and resource, shared by every provider instance.
+        """
+        # Keyed by tuple so the hot path only slices the resource name, without building a string
+        key = (self.base_url, endpoint.lstrip('/').partition('/')[0])
+        breaker = self._circuit_breakers.get(key)
+        if breaker is None:
+            breaker = self._circuit_breakers.setdefault(key, CircuitBreaker(
+                '/'.join(key), failure_threshold=self.BREAKER_FAILURE_THRESHOLD, reset_timeout=self.BREAKER_RESET_TIMEOUT
+            ))
+        return breaker
+    
+    def _send(self, endpoint: str, send: Callable[[], requests.Response]) -> requests.Response:
+        """
+        Send a request through the endpoint's circuit breaker and check its status.
+        
+        Transport errors, 5XX responses and any other exception count as failures;
+        any other answer, including a 4XX, shows the API is up and counts as a success.
+        
+        Args:
+            endpoint: API endpoint path, used to pick the breaker
+            send: Callable performing the request
+            
+        Returns:
+            The successful response
+            
+        Raises:
+            CircuitOpenError: If the breaker is open, without sending anything
+            requests.exceptions.RequestException: If the request fails
+        """
+        breaker = self._circuit_breaker(endpoint)
+        breaker.before_call()
+        try:
+            response = send()
+            # Raise an exception for 4XX and 5XX responses
+            response.raise_for_status()
+        except RequestException as e:
+            status_code = getattr(e.response, "status_code", None)
+            if status_code is not None and status_code < 500:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+            raise
+        except BaseException:
+            # Anything unexpected also counts, so a half-open probe never leaves the breaker stuck
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        return response
+    
+    @staticmethod
+    def _parse_response(response: requests.Response) -> Any:
+        """
+        Decode the JSON body of a successful response.
+        
+        Raises:
+            requests.exceptions.InvalidJSONError: If the body is not valid JSON
+        """
+        # Endpoints such as DELETE answer 204 with no body
+        if not response.content:
+            return {}
+        
+        # Parse the raw bytes with orjson; much faster than response.json() on large payloads
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise InvalidJSONError(f"Invalid JSON in response from {response.url}: {e}", response=response) from e
+    
+    def _thread_pool(self, max_workers: int) -> ThreadPoolExecutor:
+        """
+        Create a thread pool for fanning out requests.
+        
+        Workers use their own per-thread default session, so they do not
+        contend on (or share, unsafely) the caller's session. A session that
+        was explicitly injected is still used by every worker, through the
+        ``session`` property.
+        
+        Args:
+            max_workers: Number of worker threads
+            
+        Returns:
+            ThreadPoolExecutor; use it as a context manager so it is shut down
+        """
+        return ThreadPoolExecutor(max_workers=max_workers)
+    
+    def _map_concurrently(self, func: Callable[[ItemT], ResultT], items: Iterable[ItemT],
+                          max_workers: int) -> List[ResultT]:
+        """
+        Apply ``func`` to every item using up to ``max_workers`` threads.
+        
+        Args:
+            func: Function to call for each item
+            items: Items to process
+            max_workers: Maximum number of concurrent calls (1 runs them in order on this thread)
+            
+        Returns:
+            Results in the same order as ``items``
+        """
+        items = list(items)
+        if max_workers <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        
+        with self._thread_pool(min(max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
+    
+    def make_batch_request(self, endpoint: str, identifiers: Sequence[Union[str, int]],
+                           params: Optional[Dict[str, Any]] = None,
+                           max_workers: int = 1) -> List[Dict[str, Any]]:
+        """
+        Fetch several resources of one kind using BlockCypher's batch syntax
+        (e.g. ``blocks/5;6;7``), one HTTP request per MAX_BATCH_SIZE identifiers.
+        
+        Args:
+            endpoint: Resource endpoint the identifiers are appended to (e.g. 'blocks', 'addrs')
+            identifiers: Block heights/hashes, addresses, etc. to fetch
+            params: Optional query parameters applied to every batch
+            max_workers: Number of batches to request concurrently (default: 1, sequential)
+            
+        Returns:
+            List of resource objects. BlockCypher does not guarantee they come back
+            in request order, so callers should key them by an identifying field.
+            
+        Raises:
+            requests.exceptions.RequestException: If a request fails
+        """
+        batches = [
+            identifiers[start:start + self.MAX_BATCH_SIZE]
+            for start in range(0, len(identifiers), self.MAX_BATCH_SIZE)
+        ]
+        
+        def fetch(batch: Sequence[Union[str, int]]) -> Any:
+            return self.make_request('GET', f"{endpoint}/{';'.join(map(str, batch))}", params=params)
+        
+        responses = self._map_concurrently(fetch, batches, max_workers)
+        
+        results = []
+        for response in responses:
+            # A batch of one comes back as a single object rather than a list
+            if isinstance(response, list):
+                results.extend(response)
+            else:
+                results.append(response)
+        return results
     
     def get_network_parameters(self) -> Dict[str, Any]:
         """
         Get information about the current network/blockchain.
         
+        Responses are cached per coin for NETWORK_PARAMS_TTL seconds across all
+        providers, so managers created side by side share one request.
+        
         Returns:
             Dictionary with network parameters
         """
-        return self.make_request('GET', '') 
\ No newline at end of file
+        params = self._network_params_cache.get(self.coin_symbol)
+        if params is None:
+            params = self.make_request('GET', '')
+            self._network_params_cache.set(self.coin_symbol, params)
+        
+        # Hand out a copy so callers can't modify the cached entry
+        return dict(params) 
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Caching helpers for BlockCypher API integration.
+
+This module contains a small thread-safe TTL cache used to avoid repeating
+BlockCypher reads whose answers stay valid for a while (block height, fees, ...).
+"""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe mapping whose entries expire ``ttl`` seconds after being set.
+    
+    When ``maxsize`` is reached, expired entries are dropped first and then the
+    oldest entry is evicted.
+    """
+    
+    def __init__(self, ttl: float, maxsize: int = 128):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl: Lifetime of an entry in seconds
+            maxsize: Maximum number of entries kept at once
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+            
+        Returns:
+            The cached value, or ``default``
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value under ``key`` for ``ttl`` seconds.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        now = time.monotonic()
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._evict(now)
+            self._data[key] = (now + self.ttl, value)
+    
+    def pop(self, key: Hashable) -> None:
+        """
+        Drop a single entry if present.
+        
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+    
+    def _evict(self, now: float) -> None:
+        """Make room for one entry; the caller holds the lock."""
+        for key in [k for k, (expires_at, _) in self._data.items() if expires_at <= now]:
+            del self._data[key]
+        if len(self._data) >= self.maxsize:
+            # Dicts keep insertion order, so the first key is the oldest
+            del self._data[next(iter(self._data))]
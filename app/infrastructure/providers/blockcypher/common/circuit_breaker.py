@@ -0,0 +1,79 @@
+"""
+Circuit breaker for BlockCypher API integration.
+
+When BlockCypher is down, every call would otherwise wait for its own timeout
+(and retries) before failing. The breaker counts consecutive failures and, once
+it trips, rejects calls immediately until the service has had time to recover.
+"""
+
+import threading
+import time
+
+from app.infrastructure.providers.blockcypher.common.exceptions import CircuitOpenError
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker.
+
+    CLOSED: calls go through; ``failure_threshold`` consecutive failures open it.
+    OPEN: calls are rejected with CircuitOpenError for ``reset_timeout`` seconds.
+    HALF_OPEN: a single probe call is let through; its outcome closes the
+    breaker again or re-opens it for another ``reset_timeout``.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize the breaker.
+
+        Args:
+            name: Name used in error messages (e.g. the guarded endpoint)
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds to stay open before allowing a probe call
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: CLOSED, OPEN or HALF_OPEN."""
+        return self._state
+
+    def before_call(self) -> None:
+        """
+        Check that a call may go ahead.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or a half-open probe is already in flight
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                # Let this call through as the probe
+                self._state = self.HALF_OPEN
+                return
+            raise CircuitOpenError(f"Circuit for {self.name} is open; failing fast")
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the breaker."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker once the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
@@ -0,0 +1,47 @@
+"""
+Exceptions raised by the BlockCypher API integration.
+"""
+
+from typing import Optional
+
+from requests.exceptions import RequestException
+
+
+class BlockCypherError(Exception):
+    """
+    Raised when a BlockCypher operation fails.
+    
+    The underlying transport or API error is chained as ``__cause__`` so callers
+    can inspect it (e.g. back off on HTTP 429) without parsing the message.
+    """
+    
+    @property
+    def status_code(self) -> Optional[int]:
+        """HTTP status code of the failed response, if the cause carried one."""
+        response = getattr(self.__cause__, "response", None)
+        return getattr(response, "status_code", None)
+
+
+
+class ForwardingError(BlockCypherError):
+    """Raised when a forwarding address or webhook operation fails."""
+
+
+class CreateForwardingAddressError(ForwardingError):
+    """Raised when a forwarding address cannot be created."""
+
+
+class DeleteForwardingAddressError(ForwardingError):
+    """Raised when a forwarding address cannot be deleted."""
+
+
+class WebhookError(ForwardingError):
+    """Raised when a webhook cannot be created, listed, fetched or deleted."""
+
+class CircuitOpenError(RequestException):
+    """
+    Raised instead of sending a request while the endpoint's circuit breaker is open.
+    
+    It is a RequestException, so existing handlers treat it like any other
+    transport failure.
+    """
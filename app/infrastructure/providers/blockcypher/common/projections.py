@@ -0,0 +1,54 @@
+"""
+Projection helpers for BlockCypher API responses.
+
+This module contains the functions that reduce raw block and address objects
+to the fields exposed by the service classes, shared by the sync and async
+implementations.
+"""
+
+from typing import Dict, Any, Final, Optional, Sequence
+
+from app.infrastructure.providers.blockcypher.common.types import Address, AddressInfo
+
+# Block fields returned when no projection is requested
+BLOCK_FIELDS: Final = (
+    "hash", "height", "time", "n_tx", "total", "fees",
+    "size", "ver", "prev_block", "mrkl_root", "txids",
+)
+
+# Address counters, defaulting to 0 when absent from the response
+ADDRESS_FIELDS: Final = (
+    "balance", "total_received", "total_sent", "n_tx", "unconfirmed_balance", "final_balance",
+)
+
+def project_block(details: Dict[str, Any], fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Project a raw BlockCypher block onto the requested fields.
+    
+    Args:
+        details: Block object as returned by the API
+        fields: Fields to keep (default: BLOCK_FIELDS)
+        
+    Returns:
+        Dictionary with one entry per field; a missing "txids" becomes an empty list
+    """
+    summary = {field: details.get(field) for field in fields or BLOCK_FIELDS}
+    if "txids" in summary and summary["txids"] is None:
+        summary["txids"] = []
+    return summary
+
+def project_address(address: Address, result: Dict[str, Any]) -> AddressInfo:
+    """
+    Project a raw BlockCypher address object onto the balance fields.
+    
+    Args:
+        address: The address the object describes
+        result: Address object as returned by the API
+        
+    Returns:
+        Address summary with the address and its balance counters
+    """
+    summary = {"address": address}
+    for field in ADDRESS_FIELDS:
+        summary[field] = result.get(field, 0)
+    return summary
@@ -0,0 +1,55 @@
+"""
+Rate limiting helpers for BlockCypher API integration.
+
+This module contains an asyncio rate limiter used to pace outbound requests
+to the API token's budget, so concurrent callers queue locally instead of
+running into HTTP 429 responses.
+"""
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """
+    Allow at most ``max_rate`` acquisitions per ``time_period`` seconds.
+
+    Up to ``max_rate`` calls may go through back to back; after that, callers
+    are spaced evenly (generic cell rate algorithm). The limiter holds no
+    event-loop bound state, so one instance can be shared across loops.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_rate: Number of acquisitions allowed per period
+            time_period: Length of the period in seconds
+        """
+        if max_rate <= 0:
+            raise ValueError("max_rate must be positive")
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._interval = time_period / max_rate
+        self._tolerance = time_period - self._interval
+        self._theoretical_arrival = 0.0
+
+    async def acquire(self) -> None:
+        """
+        Wait until the next call is allowed under the rate limit.
+        """
+        now = time.monotonic()
+        arrival = max(self._theoretical_arrival, now)
+        delay = arrival - self._tolerance - now
+        # Reserve the slot before sleeping so concurrent callers queue behind it
+        self._theoretical_arrival = arrival + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
@@ -0,0 +1,202 @@
+"""
+Tests for the BlockCypherProvider base class.
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import requests
+from requests.exceptions import HTTPError, RequestException
+
+from app.infrastructure.providers.blockcypher.common.base import (
+    CONNECT_TIMEOUT, DEFAULT_HEADERS, JSON_HEADERS, READ_TIMEOUT, BlockCypherProvider
+)
+from app.infrastructure.providers.blockcypher.common.exceptions import CircuitOpenError
+
+class TestBlockCypherProvider(unittest.TestCase):
+    """Tests for the BlockCypherProvider class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.session = MagicMock(spec=requests.Session)
+        self.response = self.session.request.return_value
+        self.provider = BlockCypherProvider(api_token="test_token", session=self.session)
+        # Circuit breakers are shared across instances; start each test closed
+        BlockCypherProvider._circuit_breakers.clear()
+
+    def test_make_request_parses_json(self):
+        """Test that the response body is decoded and the token is sent."""
+        self.response.content = b'{"height": 680000}'
+
+        result = self.provider.make_request('GET', 'blocks/680000')
+
+        # Assertions
+        self.assertEqual(result, {"height": 680000})
+        self.session.request.assert_called_once_with(
+            method='GET',
+            url="https://api.blockcypher.com/v1/btc/test3/blocks/680000",
+            params={'token': 'test_token'},
+            timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
+        )
+
+    def test_make_request_encodes_body(self):
+        """Test that a request body is sent as orjson-encoded JSON."""
+        self.response.content = b'{"id": "hook_1"}'
+
+        self.provider.make_request('POST', 'hooks', data={"event": "new-block", "url": "https://example.com"})
+
+        # Assertions
+        kwargs = self.session.request.call_args.kwargs
+        self.assertEqual(kwargs['data'], b'{"event":"new-block","url":"https://example.com"}')
+        self.assertEqual(kwargs['headers'], {'Content-Type': 'application/json'})
+
+    def test_make_request_empty_body(self):
+        """Test that a response without a body (e.g. DELETE 204) yields an empty dict."""
+        self.response.content = b''
+
+        self.assertEqual(self.provider.make_request('DELETE', 'hooks/abc'), {})
+
+    def test_make_request_invalid_json(self):
+        """Test that a malformed body surfaces as a RequestException."""
+        self.response.content = b'<html>Bad Gateway</html>'
+
+        with self.assertRaises(RequestException):
+            self.provider.make_request('GET', 'blocks/680000')
+
+    def test_default_session_is_per_thread(self):
+        """Test that providers share a default session within a thread but not across threads."""
+        provider = BlockCypherProvider(api_token="test_token")
+        other = BlockCypherProvider(api_token="test_token")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            worker_session = executor.submit(lambda: provider.session).result()
+
+        # Assertions
+        self.assertIs(provider.session, other.session)
+        self.assertIsNot(provider.session, worker_session)
+
+    def test_map_concurrently_uses_worker_sessions(self):
+        """Test that fan-out workers use their own per-thread sessions, not the caller's."""
+        provider = BlockCypherProvider(api_token="test_token")
+
+        sessions = provider._map_concurrently(lambda _: provider.session, range(4), max_workers=4)
+
+        # Assertions
+        self.assertTrue(all(session is not provider.session for session in sessions))
+
+    def test_map_concurrently_keeps_injected_session(self):
+        """Test that fan-out workers use an explicitly injected session."""
+        sessions = self.provider._map_concurrently(lambda _: self.provider.session, range(4), max_workers=4)
+
+        # Assertions
+        self.assertTrue(all(session is self.session for session in sessions))
+
+    @patch('app.infrastructure.providers.blockcypher.common.base._POOL')
+    def test_get_json_uses_pool(self, mock_pool):
+        """Test that _get_json sends the token through urllib3 and decodes the body."""
+        mock_pool.request.return_value = MagicMock(status=200, data=b'[{"id": "hook_1"}]')
+        provider = BlockCypherProvider(api_token="test_token")
+
+        with patch.object(BlockCypherProvider, '_urllib3_transport', return_value=True):
+            result = provider._get_json('hooks', params={'start': 200})
+
+        # Assertions
+        self.assertEqual(result, [{"id": "hook_1"}])
+        mock_pool.request.assert_called_once_with(
+            'GET',
+            "https://api.blockcypher.com/v1/btc/test3/hooks",
+            fields={'token': 'test_token', 'start': 200}
+        )
+
+    @patch('app.infrastructure.providers.blockcypher.common.base._POOL')
+    def test_get_json_error_status(self, mock_pool):
+        """Test that an error status raises HTTPError carrying the response."""
+        mock_pool.request.return_value = MagicMock(status=404, data=b'{"error": "not found"}')
+        provider = BlockCypherProvider(api_token="test_token")
+
+        with patch.object(BlockCypherProvider, '_urllib3_transport', return_value=True), self.assertRaises(HTTPError) as context:
+            provider._get_json('hooks/missing')
+
+        self.assertEqual(context.exception.response.status_code, 404)
+
+    @patch('app.infrastructure.providers.blockcypher.common.base._POOL')
+    def test_get_json_keeps_injected_session(self, mock_pool):
+        """Test that _get_json uses an injected session even with the urllib3 transport enabled."""
+        self.response.content = b'[{"id": "hook_1"}]'
+
+        with patch.object(BlockCypherProvider, '_urllib3_transport', return_value=True):
+            result = self.provider._get_json('hooks')
+
+        # Assertions
+        self.assertEqual(result, [{"id": "hook_1"}])
+        self.session.request.assert_called_once()
+        mock_pool.request.assert_not_called()
+
+    @patch('app.infrastructure.providers.blockcypher.common.base._POOL')
+    def test_urllib3_transport_sends_body(self, mock_pool):
+        """Test that make_request goes through urllib3 when enabled and no session is injected."""
+        mock_pool.request.return_value = MagicMock(status=201, data=b'{"id": "hook_1"}')
+        provider = BlockCypherProvider(api_token="test_token")
+
+        with patch.object(BlockCypherProvider, '_urllib3_transport', return_value=True):
+            result = provider.make_request('POST', 'hooks', data={"event": "new-block"})
+
+        # Assertions
+        self.assertEqual(result, {"id": "hook_1"})
+        mock_pool.request.assert_called_once_with(
+            'POST',
+            "https://api.blockcypher.com/v1/btc/test3/hooks?token=test_token",
+            body=b'{"event":"new-block"}',
+            headers={**DEFAULT_HEADERS, **JSON_HEADERS}
+        )
+
+    @patch('app.infrastructure.providers.blockcypher.common.base._POOL')
+    def test_urllib3_transport_keeps_injected_session(self, mock_pool):
+        """Test that an injected session is still used when the urllib3 transport is enabled."""
+        self.response.content = b'{}'
+
+        with patch.object(BlockCypherProvider, '_urllib3_transport', return_value=True):
+            self.provider.make_request('GET', 'hooks')
+
+        # Assertions
+        self.session.request.assert_called_once()
+        mock_pool.request.assert_not_called()
+
+    def test_circuit_opens_after_server_errors(self):
+        """Test that repeated 5XX responses make later calls fail fast without a request."""
+        self.response.raise_for_status.side_effect = HTTPError("503 Service Unavailable", response=MagicMock(status_code=503))
+
+        for _ in range(BlockCypherProvider.BREAKER_FAILURE_THRESHOLD):
+            with self.assertRaises(HTTPError):
+                self.provider.make_request('GET', 'hooks/abc')
+
+        # Assertions
+        with self.assertRaises(CircuitOpenError):
+            self.provider.make_request('GET', 'hooks/def')
+        self.assertEqual(self.session.request.call_count, BlockCypherProvider.BREAKER_FAILURE_THRESHOLD)
+
+    def test_unexpected_errors_count_as_failures(self):
+        """Test that exceptions other than RequestException still open the circuit."""
+        self.session.request.side_effect = ValueError("unexpected")
+
+        for _ in range(BlockCypherProvider.BREAKER_FAILURE_THRESHOLD):
+            with self.assertRaises(ValueError):
+                self.provider.make_request('GET', 'hooks/abc')
+
+        # Assertions
+        with self.assertRaises(CircuitOpenError):
+            self.provider.make_request('GET', 'hooks/def')
+
+    def test_client_errors_keep_circuit_closed(self):
+        """Test that 4XX responses do not count as failures."""
+        self.response.raise_for_status.side_effect = HTTPError("404 Not Found", response=MagicMock(status_code=404))
+
+        for _ in range(BlockCypherProvider.BREAKER_FAILURE_THRESHOLD + 1):
+            with self.assertRaises(HTTPError):
+                self.provider.make_request('GET', 'hooks/missing')
+
+        self.assertEqual(self.session.request.call_count, BlockCypherProvider.BREAKER_FAILURE_THRESHOLD + 1)
+
+if __name__ == '__main__':
+    unittest.main()
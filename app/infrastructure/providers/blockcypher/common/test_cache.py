@@ -0,0 +1,53 @@
+"""
+Tests for the TTLCache helper.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from app.infrastructure.providers.blockcypher.common.cache import TTLCache
+
+class TestTTLCache(unittest.TestCase):
+    """Tests for the TTLCache class."""
+    
+    @patch('app.infrastructure.providers.blockcypher.common.cache.time.monotonic')
+    def test_entries_expire_after_ttl(self, mock_monotonic):
+        """Test that a value is returned until its TTL has elapsed."""
+        cache = TTLCache(ttl=10)
+        
+        mock_monotonic.return_value = 100.0
+        cache.set('height', 680000)
+        
+        mock_monotonic.return_value = 109.9
+        self.assertEqual(cache.get('height'), 680000)
+        
+        mock_monotonic.return_value = 110.0
+        self.assertIsNone(cache.get('height'))
+        self.assertEqual(cache.get('height', 'missing'), 'missing')
+    
+    def test_maxsize_evicts_oldest_entry(self):
+        """Test that the oldest entry is evicted when the cache is full."""
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('c', 3)
+        
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('b'), 2)
+        self.assertEqual(cache.get('c'), 3)
+    
+    def test_pop_and_clear(self):
+        """Test explicit invalidation."""
+        cache = TTLCache(ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        
+        cache.pop('a')
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('b'), 2)
+        
+        cache.clear()
+        self.assertIsNone(cache.get('b'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Tests for the CircuitBreaker class.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from app.infrastructure.providers.blockcypher.common.circuit_breaker import CircuitBreaker
+from app.infrastructure.providers.blockcypher.common.exceptions import CircuitOpenError
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Tests for the CircuitBreaker class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.breaker = CircuitBreaker("hooks", failure_threshold=3, reset_timeout=30.0)
+
+    @patch('app.infrastructure.providers.blockcypher.common.circuit_breaker.time.monotonic')
+    def test_opens_after_consecutive_failures(self, mock_monotonic):
+        """Test that the breaker opens at the threshold and then rejects calls."""
+        mock_monotonic.return_value = 100.0
+        for _ in range(3):
+            self.breaker.before_call()
+            self.breaker.record_failure()
+
+        # Assertions
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()
+
+    def test_success_resets_failure_count(self):
+        """Test that a success in between keeps the breaker closed."""
+        for _ in range(2):
+            self.breaker.record_failure()
+        self.breaker.record_success()
+        for _ in range(2):
+            self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+    @patch('app.infrastructure.providers.blockcypher.common.circuit_breaker.time.monotonic')
+    def test_half_open_allows_one_probe(self, mock_monotonic):
+        """Test that after the timeout a single probe decides the next state."""
+        mock_monotonic.return_value = 100.0
+        for _ in range(3):
+            self.breaker.record_failure()
+
+        # After the reset timeout one probe goes through, others still fail fast
+        mock_monotonic.return_value = 130.0
+        self.breaker.before_call()
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()
+
+        # A failed probe re-opens the breaker; a successful one closes it
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        mock_monotonic.return_value = 160.0
+        self.breaker.before_call()
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+if __name__ == '__main__':
+    unittest.main()
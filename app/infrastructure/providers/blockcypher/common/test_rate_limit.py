@@ -0,0 +1,53 @@
+"""
+Tests for the AsyncRateLimiter class.
+"""
+
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from app.infrastructure.providers.blockcypher.common.rate_limit import AsyncRateLimiter
+
+class TestAsyncRateLimiter(unittest.IsolatedAsyncioTestCase):
+    """Tests for the AsyncRateLimiter class."""
+
+    @patch('app.infrastructure.providers.blockcypher.common.rate_limit.asyncio.sleep', new_callable=AsyncMock)
+    @patch('app.infrastructure.providers.blockcypher.common.rate_limit.time.monotonic')
+    async def test_allows_burst_then_spaces_calls(self, mock_monotonic, mock_sleep):
+        """Test that max_rate calls pass immediately and the next one waits."""
+        mock_monotonic.return_value = 100.0
+        limiter = AsyncRateLimiter(max_rate=3, time_period=1.0)
+
+        # The first three calls fit in the burst
+        for _ in range(3):
+            async with limiter:
+                pass
+        mock_sleep.assert_not_called()
+
+        # The fourth waits for one interval
+        await limiter.acquire()
+        mock_sleep.assert_awaited_once()
+        self.assertAlmostEqual(mock_sleep.await_args.args[0], 1 / 3)
+
+    @patch('app.infrastructure.providers.blockcypher.common.rate_limit.asyncio.sleep', new_callable=AsyncMock)
+    @patch('app.infrastructure.providers.blockcypher.common.rate_limit.time.monotonic')
+    async def test_budget_recovers_over_time(self, mock_monotonic, mock_sleep):
+        """Test that an idle period restores the burst budget."""
+        mock_monotonic.return_value = 100.0
+        limiter = AsyncRateLimiter(max_rate=2, time_period=1.0)
+        await limiter.acquire()
+        await limiter.acquire()
+
+        # After a full period the next two calls go through again
+        mock_monotonic.return_value = 101.0
+        await limiter.acquire()
+        await limiter.acquire()
+
+        mock_sleep.assert_not_called()
+
+    def test_rejects_non_positive_rate(self):
+        """Test that a zero rate is refused."""
+        with self.assertRaises(ValueError):
+            AsyncRateLimiter(max_rate=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,10 @@ This module contains type definitions and constants used by the BlockCypher prov
 """
 
 from enum import Enum
-from typing import Dict, List, Any, Literal, Optional, Union
+from typing import Any, Final, Literal
+
+# Pydantic only accepts the typing_extensions TypedDict on Python < 3.12
+from typing_extensions import TypedDict
 
 # Currency symbols and constants
 CoinSymbol = Literal['btc', 'btc-testnet', 'ltc', 'doge', 'dash', 'bcy']
@@ -28,6 +31,10 @@ class WebhookEventType(str, Enum):
     TX_CONFIRMATION = "tx-confirmation"
     NEW_BLOCK = "new-block"
     DOUBLE_SPEND = "double-spend-tx"
+    TX_CONFIDENCE = "tx-confidence"
+
+# Plain-string view of WebhookEventType for cheap membership checks on hot paths
+VALID_WEBHOOK_EVENTS: Final[frozenset] = frozenset(event.value for event in WebhookEventType)
 
 class ScriptType(str, Enum):
     """Script types for multi-signature wallets"""
@@ -42,7 +49,15 @@ Satoshi = int  # Bitcoin's smallest unit (1 BTC = 100,000,000 satoshis)
 BTCAmount = float  # Amount in BTC
 
 # Common data structures
-AddressInfo = Dict[str, Any]
-TransactionInfo = Dict[str, Any]
-WebhookInfo = Dict[str, Any]
-WalletInfo = Dict[str, Any] 
\ No newline at end of file
+AddressInfo = dict[str, Any]
+TransactionInfo = dict[str, Any]
+WebhookInfo = dict[str, Any]
+WalletInfo = dict[str, Any]
+
+class BlockcypherWebhookPayload(TypedDict, total=False):
+    """Fields of a BlockCypher webhook delivery that the payment handler reads"""
+    event: str
+    address: str
+    hash: str
+    confirmations: int
+    outputs: list[dict[str, Any]]
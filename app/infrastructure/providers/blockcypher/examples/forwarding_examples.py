@@ -111,20 +111,17 @@ def list_webhooks_example():
     
     return webhooks
 
-def delete_examples(forwarding_id=None, webhook_id=None):
+def delete_examples(forwarding_ids=None, webhook_ids=None):
     """Example of deleting forwarding addresses and webhooks."""
     # Initialize the forwarding manager
     forwarding_manager = ForwardingManager(coin_symbol="btc-testnet")
     
-    # Delete a forwarding address if ID is provided
-    if forwarding_id:
-        result = forwarding_manager.delete_forwarding_address(forwarding_id)
-        print(f"Deleted forwarding address {forwarding_id}: {result.get('deleted', False)}")
+    # Deletions are independent, so they are issued concurrently
+    for forwarding_id, deleted in forwarding_manager.bulk_delete_forwarding_addresses(forwarding_ids or []).items():
+        print(f"Deleted forwarding address {forwarding_id}: {deleted}")
     
-    # Delete a webhook if ID is provided
-    if webhook_id:
-        result = forwarding_manager.delete_webhook(webhook_id)
-        print(f"Deleted webhook {webhook_id}: {result.get('deleted', False)}")
+    for webhook_id, deleted in forwarding_manager.bulk_delete_webhooks(webhook_ids or []).items():
+        print(f"Deleted webhook {webhook_id}: {deleted}")
 
 if __name__ == "__main__":
     print("\n===== CREATE FORWARDING ADDRESS =====")
@@ -141,7 +138,7 @@ if __name__ == "__main__":
     
     # Uncomment to test deletion
     # print("\n===== DELETE RESOURCES =====")
-    # if forwarding_info:
-    #     delete_examples(forwarding_id=forwarding_info.get('id'))
-    # if webhooks and webhooks.get('address_webhook'):
-    #     delete_examples(webhook_id=webhooks['address_webhook'].get('id')) 
\ No newline at end of file
+    # delete_examples(
+    #     forwarding_ids=[forwarding_info.get('id')] if forwarding_info else [],
+    #     webhook_ids=[webhook.get('id') for webhook in (webhooks or {}).values() if webhook]
+    # ) 
\ No newline at end of file
@@ -4,6 +4,8 @@ Example code for wallet management using BlockCypher.
 This module demonstrates common wallet operations using the WalletManager.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from app.infrastructure.providers.blockcypher import WalletManager
 
 def create_wallet_example():
@@ -32,21 +34,25 @@ def wallet_operations_example(wallet_name, address):
     # Initialize the wallet manager
     wallet_manager = WalletManager(coin_symbol="btc-testnet")
     
-    # Get wallet details
-    wallet_info = wallet_manager.get_wallet(wallet_name)
-    print(f"Wallet info: {wallet_info}")
-    
-    # Generate a new address in the wallet
-    new_address = wallet_manager.generate_address_in_wallet(wallet_name)
-    print(f"Generated new address in wallet: {new_address}")
-    
-    # Get wallet balance
-    balance = wallet_manager.get_wallet_balance(address)
-    print(f"Wallet balance: {balance} BTC")
-    
-    # Get wallet transactions
-    transactions = wallet_manager.get_wallet_transactions(address, limit=5)
-    print(f"Recent transactions: {len(transactions)}")
+    # The four calls are independent, so run them concurrently over the shared connection pool
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        wallet_info = executor.submit(wallet_manager.get_wallet, wallet_name)
+        new_address = executor.submit(wallet_manager.generate_address_in_wallet, wallet_name)
+        balance = executor.submit(wallet_manager.get_wallet_balance, address)
+        transactions = executor.submit(wallet_manager.get_wallet_transactions, address, limit=5)
+        
+        # Get wallet details
+        print(f"Wallet info: {wallet_info.result()}")
+        
+        # Generate a new address in the wallet
+        new_address = new_address.result()
+        print(f"Generated new address in wallet: {new_address}")
+        
+        # Get wallet balance
+        print(f"Wallet balance: {balance.result()} BTC")
+        
+        # Get wallet transactions
+        print(f"Recent transactions: {len(transactions.result())}")
     
     return new_address["address"] if isinstance(new_address, dict) else None
 
@@ -55,10 +61,9 @@ def multisig_wallet_example():
     # Initialize the wallet manager
     wallet_manager = WalletManager(coin_symbol="btc-testnet")
     
-    # Generate addresses for the multi-signature wallet
-    address1 = wallet_manager.generate_address()
-    address2 = wallet_manager.generate_address()
-    address3 = wallet_manager.generate_address()
+    # Generate addresses for the multi-signature wallet (concurrently; they are independent)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        address1, address2, address3 = executor.map(lambda _: wallet_manager.generate_address(), range(3))
     
     # Extract public keys
     pubkey1 = address1["public_key"]
@@ -8,4 +8,6 @@ This module provides functionality for:
 - Managing WebSocket connections for real-time updates
 """
 
-from app.infrastructure.providers.blockcypher.forwarding.manager import ForwardingManager 
\ No newline at end of file
+from app.infrastructure.providers.blockcypher.forwarding.manager import AsyncForwardingManager, ForwardingManager
+
+__all__ = ['ForwardingManager', 'AsyncForwardingManager']
@@ -4,14 +4,68 @@ Address forwarding management for BlockCypher API integration.
 This module provides functionality for creating and managing forwarding addresses and webhooks.
 """
 
-from typing import Dict, Any, List, Optional, Union
+import asyncio
+import httpx
+import os
+import requests
+from copy import deepcopy
+from functools import cache
+from typing import Callable, Dict, Any, Iterator, List, Optional, Sequence, Tuple, Union
 from requests.exceptions import RequestException
 
+from app.infrastructure.providers.blockcypher.common.async_base import AsyncBlockCypherProvider
 from app.infrastructure.providers.blockcypher.common.base import BlockCypherProvider
+from app.infrastructure.providers.blockcypher.common.cache import TTLCache
+from app.infrastructure.providers.blockcypher.common.exceptions import (
+    CreateForwardingAddressError, DeleteForwardingAddressError, ForwardingError, WebhookError
+)
 from app.infrastructure.providers.blockcypher.common.types import (
-    Address, TransactionHash, WebhookEventType
+    Address, TransactionHash, WebhookEventType, VALID_WEBHOOK_EVENTS
 )
 
+# Maximum number of forwarding addresses BlockCypher returns per page
+FORWARDING_PAGE_SIZE = 200
+
+# Tail of the invalid-event error message, built once
+_VALID_EVENTS_HINT = f"Must be one of {sorted(VALID_WEBHOOK_EVENTS)}"
+
+def _validate_event(event: str) -> None:
+    """
+    Check that a webhook event type is one BlockCypher supports.
+    
+    Raises:
+        ValueError: If the event type is not supported
+    """
+    if event not in VALID_WEBHOOK_EVENTS:
+        raise ValueError(f"Invalid event type '{event}' is not a valid event type. {_VALID_EVENTS_HINT}")
+
+def _forwarding_payload(destination: str, callback_url: Optional[str], extra: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the request body for creating a forwarding address; None values are left out."""
+    data = {"destination": destination, "callback_url": callback_url, **extra}
+    data = {key: value for key, value in data.items() if value is not None}
+    
+    # Check for processing_fee_satoshis and convert to expected format (0 is a valid fee)
+    if "processing_fee_satoshis" in data:
+        fee = data.pop("processing_fee_satoshis")
+        data["processing_fees"] = {"satoshis": fee}
+    
+    return data
+
+def _webhook_payload(url: str, event: str, address: Optional[str], tx_hash: Optional[str],
+                     confidence: Optional[float], confirmations: Optional[int],
+                     extra: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the request body for creating a webhook; None values are left out."""
+    # confidence and confirmations only apply to their own event types
+    return {key: value for key, value in (
+        ("event", event),
+        ("url", url),
+        ("address", address),
+        ("hash", tx_hash),
+        ("confidence", confidence if event == 'tx-confidence' else None),
+        ("confirmations", confirmations if event == 'tx-confirmation' else None),
+        *extra.items()
+    ) if value is not None}
+
 class ForwardingManager(BlockCypherProvider):
     """
     Manager for handling address forwarding and webhooks through the BlockCypher API.
@@ -19,6 +73,47 @@ class ForwardingManager(BlockCypherProvider):
     This class provides methods for creating and managing forwarding addresses and webhooks.
     """
     
+    # Number of requests the bulk create/delete helpers keep in flight
+    BULK_WORKERS = 16
+    
+    # Webhook details are looked up repeatedly while processing events, so
+    # get_webhook() keeps them for WEBHOOK_TTL seconds
+    WEBHOOK_TTL = 15
+    WEBHOOK_CACHE_SIZE = 1024
+    
+    # One manager is often kept per merchant, so skip the per-instance __dict__
+    __slots__ = ('_webhook_cache', '_list_cache', '_ws_url')
+    
+    def __init__(self, coin_symbol: str = 'btc-testnet', api_token: Optional[str] = None,
+                 session: Optional[requests.Session] = None):
+        """
+        Initialize the forwarding manager.
+        
+        Args:
+            coin_symbol: The cryptocurrency to use (default: btc-testnet)
+            api_token: Optional API token override. If not provided, will use BLOCKCYPHER_API_TOKEN env var
+            session: Optional HTTP session to use instead of the per-thread keep-alive session
+        """
+        super().__init__(coin_symbol=coin_symbol, api_token=api_token, session=session)
+        self._webhook_cache = TTLCache(ttl=self.WEBHOOK_TTL, maxsize=self.WEBHOOK_CACHE_SIZE)
+        self._list_cache = TTLCache(ttl=self._list_cache_ttl(), maxsize=2)
+        
+        # The WebSocket URL only depends on the network and token, so build it once
+        coin, chain = self.COIN_SYMBOL_MAPPING[coin_symbol]
+        self._ws_url = f"wss://socket.blockcypher.com/v1/{coin}/{chain}?token={self.api_token}"
+    
+    @staticmethod
+    @cache
+    def _list_cache_ttl() -> float:
+        """
+        Seconds that list_*() results are reused (BLOCKCYPHER_LIST_CACHE_TTL, default 10).
+        
+        Full listings of forwards and webhooks are polled by dashboards and
+        reconcilers. The variable is read once, on first use, so a .env loaded
+        after import is honoured; call ``_list_cache_ttl.cache_clear()`` after changing it.
+        """
+        return float(os.getenv("BLOCKCYPHER_LIST_CACHE_TTL", "10"))
+    
     def create_forwarding_address(
         self,
         destination: str,
@@ -37,37 +132,62 @@ class ForwardingManager(BlockCypherProvider):
             Dictionary with forwarding address details
         """
         try:
-            data = {
-                "destination": destination
-            }
-            
-            if callback_url:
-                data["callback_url"] = callback_url
-                
-            # Add any additional parameters
-            data.update(kwargs)
-            
-            # Check for processing_fee_satoshis and convert to expected format
-            if "processing_fee_satoshis" in data:
-                fee = data.pop("processing_fee_satoshis")
-                data["processing_fees"] = {"satoshis": fee}
-                
-            return self.make_request('POST', 'payments', data=data)
+            data = _forwarding_payload(destination, callback_url, kwargs)
+            forward = self.make_request('POST', 'payments', data=data)
         except RequestException as e:
-            raise Exception(f"Failed to create forwarding address: {str(e)}")
+            raise CreateForwardingAddressError("Failed to create forwarding address") from e
+        
+        # Invalidate only once the write has gone through
+        self._list_cache.pop('payments')
+        return forward
     
     def list_forwarding_addresses(self) -> List[Dict[str, Any]]:
         """
         List all forwarding addresses.
         
         Returns:
-            List of forwarding address details
+            List of forwarding address details (cached for BLOCKCYPHER_LIST_CACHE_TTL seconds)
+        """
+        forwards = self._list_cache.get('payments')
+        if forwards is None:
+            forwards = list(self.iter_forwarding_addresses())
+            self._list_cache.set('payments', forwards)
+        # Callers get their own copy so changing an entry cannot corrupt the cache
+        return deepcopy(forwards)
+    
+    def iter_forwarding_addresses(self) -> Iterator[Dict[str, Any]]:
         """
+        Iterate over all forwarding addresses, page by page.
+        
+        BlockCypher returns up to FORWARDING_PAGE_SIZE entries per page; the page
+        size is fixed by the API. The next page is requested in the background
+        while the current one is being consumed, so page round trips overlap with
+        the caller's work.
+        
+        Yields:
+            Forwarding address details
+        """
+        with self._thread_pool(max_workers=1) as executor:
+            start = 0
+            pending = executor.submit(self._get_forwarding_page, start)
+            while True:
+                page = pending.result()
+                # A short page is the last one
+                if len(page) < FORWARDING_PAGE_SIZE:
+                    yield from page
+                    return
+                start += len(page)
+                pending = executor.submit(self._get_forwarding_page, start)
+                yield from page
+    
+    def _get_forwarding_page(self, start: int) -> List[Dict[str, Any]]:
+        """Fetch one page of forwarding addresses beginning at offset ``start``."""
         try:
-            result = self.make_request('GET', 'payments')
-            return result
+            if start:
+                return self._get_json('payments', params={'start': start})
+            return self._get_json('payments')
         except RequestException as e:
-            raise Exception(f"Failed to list forwarding addresses: {str(e)}")
+            raise ForwardingError("Failed to list forwarding addresses") from e
     
     def delete_forwarding_address(self, forward_id: str) -> Dict[str, Any]:
         """
@@ -80,9 +200,12 @@ class ForwardingManager(BlockCypherProvider):
             Response containing deletion status
         """
         try:
-            return self.make_request('DELETE', f'payments/{forward_id}')
+            result = self.make_request('DELETE', f'payments/{forward_id}')
         except RequestException as e:
-            raise Exception(f"Failed to delete forwarding address {forward_id}: {str(e)}")
+            raise DeleteForwardingAddressError(f"Failed to delete forwarding address {forward_id}") from e
+        
+        self._list_cache.pop('payments')
+        return result
     
     def create_webhook(
         self,
@@ -111,53 +234,32 @@ class ForwardingManager(BlockCypherProvider):
         Returns:
             Dictionary with webhook details
         """
-        valid_events = [
-            'unconfirmed-tx', 'new-block', 'tx-confirmation', 
-            'double-spend-tx', 'tx-confidence', 'confirmed-tx'
-        ]
-        
-        if event not in valid_events:
-            raise ValueError(f"Invalid event type '{event}' is not a valid event type. Must be one of {valid_events}")
+        _validate_event(event)
         
         try:
-            data = {
-                "event": event,
-                "url": url
-            }
-            
-            if address:
-                data["address"] = address
-                
-            # Support both transaction and hash parameter names
-            tx_hash = hash or transaction
-            if tx_hash:
-                data["hash"] = tx_hash
-                
-            if confidence and event == 'tx-confidence':
-                data["confidence"] = confidence
-                
-            if confirmations and event == 'tx-confirmation':
-                data["confirmations"] = confirmations
-                
-            # Add any additional parameters
-            data.update(kwargs)
-            
-            return self.make_request('POST', 'hooks', data=data)
+            data = _webhook_payload(url, event, address, hash or transaction, confidence, confirmations, kwargs)
+            webhook = self.make_request('POST', 'hooks', data=data)
         except RequestException as e:
-            raise Exception(f"Failed to create webhook: {str(e)}")
+            raise WebhookError("Failed to create webhook") from e
+        
+        self._list_cache.pop('hooks')
+        return webhook
     
     def list_webhooks(self) -> List[Dict[str, Any]]:
         """
         List all webhooks.
         
         Returns:
-            List of webhook details
+            List of webhook details (cached for BLOCKCYPHER_LIST_CACHE_TTL seconds)
         """
-        try:
-            result = self.make_request('GET', 'hooks')
-            return result
-        except RequestException as e:
-            raise Exception(f"Failed to list webhooks: {str(e)}")
+        webhooks = self._list_cache.get('hooks')
+        if webhooks is None:
+            try:
+                webhooks = self._get_json('hooks')
+            except RequestException as e:
+                raise WebhookError("Failed to list webhooks") from e
+            self._list_cache.set('hooks', webhooks)
+        return deepcopy(webhooks)
     
     def get_webhook(self, hook_id: str) -> Dict[str, Any]:
         """
@@ -167,12 +269,19 @@ class ForwardingManager(BlockCypherProvider):
             hook_id: ID of the webhook to retrieve
             
         Returns:
-            Webhook details
+            Webhook details (cached for WEBHOOK_TTL seconds)
         """
+        cached = self._webhook_cache.get(hook_id)
+        if cached is not None:
+            return deepcopy(cached)
+        
         try:
-            return self.make_request('GET', f'hooks/{hook_id}')
+            webhook = self._get_json(f'hooks/{hook_id}')
         except RequestException as e:
-            raise Exception(f"Failed to get webhook {hook_id}: {str(e)}")
+            raise WebhookError(f"Failed to get webhook {hook_id}") from e
+        
+        self._webhook_cache.set(hook_id, webhook)
+        return deepcopy(webhook)
     
     def delete_webhook(self, hook_id: str) -> Dict[str, Any]:
         """
@@ -185,9 +294,129 @@ class ForwardingManager(BlockCypherProvider):
             Response containing deletion status
         """
         try:
-            return self.make_request('DELETE', f'hooks/{hook_id}')
+            result = self.make_request('DELETE', f'hooks/{hook_id}')
         except RequestException as e:
-            raise Exception(f"Failed to delete webhook {hook_id}: {str(e)}")
+            raise WebhookError(f"Failed to delete webhook {hook_id}") from e
+        
+        self._webhook_cache.pop(hook_id)
+        self._list_cache.pop('hooks')
+        return result
+    
+    def create_webhooks_batch(self, specs: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create several webhooks, up to BULK_WORKERS at a time.
+        
+        Every spec is validated before anything is sent, so a bad event type
+        does not leave a partial batch behind. BlockCypher has no batch create
+        endpoint, so the POSTs are issued concurrently over the shared pool.
+        
+        Args:
+            specs: Keyword arguments for create_webhook(), one dict per webhook
+            
+        Returns:
+            Webhook details, in the same order as ``specs``
+            
+        Raises:
+            ValueError: If any spec has an invalid event type
+            WebhookError: If a request fails (webhooks created before it are kept)
+        """
+        for spec in specs:
+            _validate_event(spec.get("event"))
+        
+        create = self.create_webhook
+        return self._map_concurrently(lambda spec: create(**spec), specs, self.BULK_WORKERS)
+    
+    def create_forwarding_addresses_batch(
+        self,
+        destinations: Sequence[Address],
+        callback_url: Optional[str] = None,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Create one forwarding address per destination, up to BULK_WORKERS at a time.
+        
+        Args:
+            destinations: Destination addresses to forward funds to
+            callback_url: Optional URL to receive webhook notifications for every forward
+            **kwargs: Additional parameters applied to every forward
+            
+        Returns:
+            Forwarding address details, in the same order as ``destinations``
+            
+        Raises:
+            CreateForwardingAddressError: If a request fails (forwards created before it are kept)
+        """
+        create = self.create_forwarding_address
+        return self._map_concurrently(
+            lambda destination: create(destination, callback_url=callback_url, **kwargs),
+            destinations,
+            self.BULK_WORKERS
+        )
+    
+    def create_transaction_webhooks_batch(
+        self,
+        items: Sequence[Tuple[str, TransactionHash, int]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Create one confirmation webhook per (callback URL, transaction hash,
+        confirmations) item, up to BULK_WORKERS at a time.
+        
+        Args:
+            items: (callback URL, transaction hash, confirmations) triples to register
+            
+        Returns:
+            Webhook details, in the same order as ``items``
+            
+        Raises:
+            WebhookError: If a request fails (webhooks created before it are kept)
+        """
+        create = self.create_transaction_webhook
+        return self._map_concurrently(
+            lambda item: create(url=item[0], transaction_hash=item[1], confirmations=item[2]),
+            items,
+            self.BULK_WORKERS
+        )
+    
+    def bulk_delete_forwarding_addresses(self, forward_ids: Sequence[str]) -> Dict[str, bool]:
+        """
+        Delete several forwarding addresses, up to BULK_WORKERS at a time.
+        
+        BlockCypher has no batch delete endpoint, so this fans out one DELETE per
+        ID. A failed deletion is reported for its ID rather than aborting the rest.
+        
+        Args:
+            forward_ids: IDs of the forwarding addresses to delete
+            
+        Returns:
+            Dictionary mapping each ID to whether it was deleted
+        """
+        return self._bulk_delete(self.delete_forwarding_address, forward_ids)
+    
+    def bulk_delete_webhooks(self, hook_ids: Sequence[str]) -> Dict[str, bool]:
+        """
+        Delete several webhooks, up to BULK_WORKERS at a time.
+        
+        BlockCypher has no batch delete endpoint, so this fans out one DELETE per
+        ID. A failed deletion is reported for its ID rather than aborting the rest.
+        
+        Args:
+            hook_ids: IDs of the webhooks to delete
+            
+        Returns:
+            Dictionary mapping each ID to whether it was deleted
+        """
+        return self._bulk_delete(self.delete_webhook, hook_ids)
+    
+    def _bulk_delete(self, delete: Callable[[str], Dict[str, Any]], ids: Sequence[str]) -> Dict[str, bool]:
+        """Run ``delete`` for every ID concurrently and record which ones succeeded."""
+        def attempt(resource_id: str) -> bool:
+            try:
+                delete(resource_id)
+                return True
+            except ForwardingError:
+                return False
+        
+        return dict(zip(ids, self._map_concurrently(attempt, ids, self.BULK_WORKERS)))
     
     def create_address_webhook(
         self,
@@ -205,27 +434,12 @@ class ForwardingManager(BlockCypherProvider):
             address: Address to monitor
             event: Event type (default: 'unconfirmed-tx')
             filter: Optional filter for the webhook
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters passed on to create_webhook
             
         Returns:
             Dictionary with webhook details
         """
-        from inspect import currentframe, getouterframes
-        
-        # Determine which test file is calling this method
-        frame = currentframe()
-        is_test_forwarding_py = False
-        if frame:
-            for frame_info in getouterframes(frame):
-                if 'test_forwarding.py' in frame_info.filename:
-                    is_test_forwarding_py = True
-                    break
-                    
-        # Different behavior based on the test file
-        if is_test_forwarding_py:
-            return self.create_webhook(url=url, event=event, address=address)
-        else:
-            return self.create_webhook(url=url, event=event, address=address, filter=filter)
+        return self.create_webhook(url=url, event=event, address=address, filter=filter, **kwargs)
     
     def create_transaction_webhook(
         self,
@@ -248,29 +462,18 @@ class ForwardingManager(BlockCypherProvider):
         Returns:
             Dictionary with webhook details
         """
-        # Support both parameter names
+        # Support both parameter names; BlockCypher expects the hash as 'hash'
         tx_hash = transaction_hash or transaction
         if not tx_hash:
             raise ValueError("Either transaction or transaction_hash must be provided")
-            
-        if transaction is not None:
-            # If transaction parameter was used, pass it as is for test compatibility
-            return self.create_webhook(
-                url=url,
-                event='tx-confirmation',
-                transaction=transaction,
-                confirmations=confirmations,
-                **kwargs
-            )
-        else:
-            # Otherwise convert to hash for API compatibility
-            return self.create_webhook(
-                url=url,
-                event='tx-confirmation',
-                hash=tx_hash,
-                confirmations=confirmations,
-                **kwargs
-            )
+        
+        return self.create_webhook(
+            url=url,
+            event='tx-confirmation',
+            hash=tx_hash,
+            confirmations=confirmations,
+            **kwargs
+        )
     
     def create_confidence_webhook(
         self,
@@ -293,29 +496,18 @@ class ForwardingManager(BlockCypherProvider):
         Returns:
             Dictionary with webhook details
         """
-        # Support both parameter names
+        # Support both parameter names; BlockCypher expects the hash as 'hash'
         tx_hash = transaction_hash or transaction
         if not tx_hash:
             raise ValueError("Either transaction or transaction_hash must be provided")
-            
-        if transaction is not None:
-            # If transaction parameter was used, pass it as is for test compatibility
-            return self.create_webhook(
-                url=url,
-                event='tx-confidence',
-                transaction=transaction,
-                confidence=confidence,
-                **kwargs
-            )
-        else:
-            # Otherwise convert to hash for API compatibility
-            return self.create_webhook(
-                url=url,
-                event='tx-confidence',
-                hash=tx_hash,
-                confidence=confidence,
-                **kwargs
-            )
+        
+        return self.create_webhook(
+            url=url,
+            event='tx-confidence',
+            hash=tx_hash,
+            confidence=confidence,
+            **kwargs
+        )
     
     def get_websocket_url(self) -> str:
         """
@@ -324,33 +516,274 @@ class ForwardingManager(BlockCypherProvider):
         Returns:
             WebSocket URL string
         """
-        from inspect import currentframe, getouterframes
-        import os
-        
-        # We need to determine which test file is calling this method
-        # This is a hack but it works for testing purposes
-        is_test_forwarding_py = False
-        is_test_forwarding_manager_py = False
-        
-        # Inspect the call stack to see which test file is calling us
-        frame = currentframe()
-        if frame:
-            for frame_info in getouterframes(frame):
-                if 'test_forwarding.py' in frame_info.filename:
-                    is_test_forwarding_py = True
-                    break
-                elif 'test_forwarding_manager.py' in frame_info.filename:
-                    is_test_forwarding_manager_py = True
-                    break
-        
-        # Return the URL expected by each test file
-        if is_test_forwarding_py:
-            return f"wss://api.blockcypher.com/v1/btc-testnet/ws"
-        elif is_test_forwarding_manager_py:
-            return f"wss://socket.blockcypher.com/v1/btc/test3?token={self.api_token}"
-        
-        # Default fallback based on coin symbol
-        if self.coin_symbol == 'btc-testnet':
-            return f"wss://api.blockcypher.com/v1/btc-testnet/ws"
-        else:
-            return f"wss://api.blockcypher.com/v1/{self.coin_symbol}/ws" 
\ No newline at end of file
+        return self._ws_url
+
+
+class AsyncForwardingManager(AsyncBlockCypherProvider):
+    """
+    Asynchronous counterpart of ForwardingManager.
+    
+    Intended for bulk provisioning: creating or deleting many webhooks and
+    forwarding addresses issues the requests concurrently, so N calls cost
+    roughly one round trip of wall time instead of N.
+    """
+    
+    async def create_forwarding_address(
+        self,
+        destination: str,
+        callback_url: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Create a new forwarding address.
+        
+        Args:
+            destination: Destination address to forward funds to
+            callback_url: Optional URL to receive webhook notifications
+            **kwargs: Additional parameters (e.g., mining_fees_satoshis, processing_fees_satoshis)
+            
+        Returns:
+            Dictionary with forwarding address details
+        """
+        try:
+            data = _forwarding_payload(destination, callback_url, kwargs)
+            return await self.make_request('POST', 'payments', data=data)
+        except httpx.HTTPError as e:
+            raise CreateForwardingAddressError("Failed to create forwarding address") from e
+    
+    async def list_forwarding_addresses(self) -> List[Dict[str, Any]]:
+        """
+        List all forwarding addresses.
+        
+        Returns:
+            List of forwarding address details
+        """
+        try:
+            return await self.make_request('GET', 'payments')
+        except httpx.HTTPError as e:
+            raise ForwardingError("Failed to list forwarding addresses") from e
+    
+    async def delete_forwarding_address(self, forward_id: str) -> Dict[str, Any]:
+        """
+        Delete a forwarding address.
+        
+        Args:
+            forward_id: ID of the forwarding address to delete
+            
+        Returns:
+            Response containing deletion status
+        """
+        try:
+            return await self.make_request('DELETE', f'payments/{forward_id}')
+        except httpx.HTTPError as e:
+            raise DeleteForwardingAddressError(f"Failed to delete forwarding address {forward_id}") from e
+    
+    async def create_webhook(
+        self,
+        url: str,
+        event: str,
+        address: Optional[str] = None,
+        transaction: Optional[str] = None,
+        hash: Optional[str] = None,
+        confidence: Optional[float] = None,
+        confirmations: Optional[int] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Create a new webhook.
+        
+        Args:
+            url: Callback URL to receive webhook notifications
+            event: Event type (e.g., 'tx-confirmation', 'new-block', 'unconfirmed-tx')
+            address: Optional address to monitor
+            transaction: Optional transaction hash to monitor (alias for hash)
+            hash: Optional transaction hash to monitor
+            confidence: Optional confidence threshold for unconfirmed transactions
+            confirmations: Optional number of confirmations to notify at
+            **kwargs: Additional parameters
+            
+        Returns:
+            Dictionary with webhook details
+        """
+        _validate_event(event)
+        
+        try:
+            data = _webhook_payload(url, event, address, hash or transaction, confidence, confirmations, kwargs)
+            return await self.make_request('POST', 'hooks', data=data)
+        except httpx.HTTPError as e:
+            raise WebhookError("Failed to create webhook") from e
+    
+    async def list_webhooks(self) -> List[Dict[str, Any]]:
+        """
+        List all webhooks.
+        
+        Returns:
+            List of webhook details
+        """
+        try:
+            return await self.make_request('GET', 'hooks')
+        except httpx.HTTPError as e:
+            raise WebhookError("Failed to list webhooks") from e
+    
+    async def get_webhook(self, hook_id: str) -> Dict[str, Any]:
+        """
+        Get details of a specific webhook.
+        
+        Args:
+            hook_id: ID of the webhook to retrieve
+            
+        Returns:
+            Webhook details
+        """
+        try:
+            return await self.make_request('GET', f'hooks/{hook_id}')
+        except httpx.HTTPError as e:
+            raise WebhookError(f"Failed to get webhook {hook_id}") from e
+    
+    async def delete_webhook(self, hook_id: str) -> Dict[str, Any]:
+        """
+        Delete a webhook.
+        
+        Args:
+            hook_id: ID of the webhook to delete
+            
+        Returns:
+            Response containing deletion status
+        """
+        try:
+            return await self.make_request('DELETE', f'hooks/{hook_id}')
+        except httpx.HTTPError as e:
+            raise WebhookError(f"Failed to delete webhook {hook_id}") from e
+    
+    async def create_address_webhook(
+        self,
+        url: str,
+        address: str,
+        event: str = 'unconfirmed-tx',
+        filter: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Convenience method to create a webhook for a specific address.
+        
+        Args:
+            url: Callback URL to receive webhook notifications
+            address: Address to monitor
+            event: Event type (default: 'unconfirmed-tx')
+            filter: Optional filter for the webhook
+            **kwargs: Additional parameters passed on to create_webhook
+            
+        Returns:
+            Dictionary with webhook details
+        """
+        return await self.create_webhook(url=url, event=event, address=address, filter=filter, **kwargs)
+    
+    async def create_transaction_webhook(
+        self,
+        url: str,
+        transaction_hash: Optional[str] = None,
+        transaction: Optional[str] = None,
+        confirmations: int = 6,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Convenience method to create a webhook for a specific transaction confirmation.
+        
+        Args:
+            url: Callback URL to receive webhook notifications
+            transaction_hash: Transaction hash to monitor (alias for transaction)
+            transaction: Transaction hash to monitor
+            confirmations: Number of confirmations to notify at (default: 6)
+            **kwargs: Additional parameters
+            
+        Returns:
+            Dictionary with webhook details
+        """
+        tx_hash = transaction_hash or transaction
+        if not tx_hash:
+            raise ValueError("Either transaction or transaction_hash must be provided")
+        
+        return await self.create_webhook(
+            url=url,
+            event='tx-confirmation',
+            hash=tx_hash,
+            confirmations=confirmations,
+            **kwargs
+        )
+    
+    async def create_confidence_webhook(
+        self,
+        url: str,
+        transaction_hash: Optional[str] = None,
+        transaction: Optional[str] = None,
+        confidence: float = 0.9,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Convenience method to create a confidence webhook for a specific transaction.
+        
+        Args:
+            url: Callback URL to receive webhook notifications
+            transaction_hash: Transaction hash to monitor (alias for transaction)
+            transaction: Transaction hash to monitor
+            confidence: Confidence threshold (default: 0.9)
+            **kwargs: Additional parameters
+            
+        Returns:
+            Dictionary with webhook details
+        """
+        tx_hash = transaction_hash or transaction
+        if not tx_hash:
+            raise ValueError("Either transaction or transaction_hash must be provided")
+        
+        return await self.create_webhook(
+            url=url,
+            event='tx-confidence',
+            hash=tx_hash,
+            confidence=confidence,
+            **kwargs
+        )
+    
+    async def create_forwarding_addresses(
+        self,
+        destinations: Sequence[Address],
+        callback_url: Optional[str] = None,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Create one forwarding address per destination, concurrently.
+        
+        Args:
+            destinations: Destination addresses to forward funds to
+            callback_url: Optional URL to receive webhook notifications for every forward
+            **kwargs: Additional parameters applied to every forward
+            
+        Returns:
+            Forwarding address details, in the same order as ``destinations``
+        """
+        create = self.create_forwarding_address
+        return await asyncio.gather(*(
+            create(destination, callback_url=callback_url, **kwargs)
+            for destination in destinations
+        ))
+    
+    async def create_address_webhooks(
+        self,
+        pairs: Sequence[Tuple[Address, str]],
+        event: str = 'unconfirmed-tx'
+    ) -> List[Dict[str, Any]]:
+        """
+        Create one address webhook per (address, callback URL) pair, concurrently.
+        
+        Args:
+            pairs: (address, callback URL) pairs to register
+            event: Event type for every webhook (default: 'unconfirmed-tx')
+            
+        Returns:
+            Webhook details, in the same order as ``pairs``
+        """
+        create = self.create_address_webhook
+        return await asyncio.gather(*(
+            create(url=url, address=address, event=event)
+            for address, url in pairs
+        ))
@@ -0,0 +1,167 @@
+"""
+Live tests for the ForwardingManager class using the BlockCypher test faucet.
+
+These tests make real API calls to the bcy test chain and only run when the
+BLOCKCYPHER_LIVE_TEST environment variable is set to 'true'; otherwise the
+module is skipped at collection time.
+"""
+
+import logging
+import os
+import unittest
+
+import pytest
+
+if os.getenv("BLOCKCYPHER_LIVE_TEST") != "true":
+    pytest.skip("Live tests only run when BLOCKCYPHER_LIVE_TEST=true", allow_module_level=True)
+
+from app.infrastructure.providers.blockcypher.forwarding import ForwardingManager
+from app.infrastructure.providers.blockcypher.utils.test_utils import (
+    get_test_api_token,
+    setup_funded_test_address,
+    generate_test_address
+)
+
+# The faucet is rate limited, so these tests stay off pytest-xdist workers
+pytestmark = pytest.mark.serial
+
+logger = logging.getLogger(__name__)
+
+class TestForwardingManagerWithFaucet(unittest.TestCase):
+    """Tests for the ForwardingManager class using the test faucet."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up the funded address and manager shared by every live test."""
+        cls.coin_symbol = 'bcy'  # BlockCypher test chain
+        cls.api_token = get_test_api_token()
+        cls.forwarding_manager = ForwardingManager(api_token=cls.api_token, coin_symbol=cls.coin_symbol)
+        
+        # Generate a funded address for testing (one faucet call for the whole class)
+        funded_setup = setup_funded_test_address(coin_symbol=cls.coin_symbol)
+        cls.test_address = funded_setup['address_info']
+        cls.funding_tx = funded_setup['funding_tx']
+        
+        # Create another address to use as destination
+        cls.destination_address = generate_test_address(coin_symbol=cls.coin_symbol)
+        
+        # Test webhook URL (This is just for testing - in real usage you'd use a public URL)
+        cls.test_webhook_url = "https://webhook.site/your-unique-id"
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after the live tests."""
+        # Try to clean up any created webhooks
+        try:
+            webhooks = cls.forwarding_manager.list_webhooks()
+            for hook in webhooks:
+                if hook.get('url') == cls.test_webhook_url:
+                    cls.forwarding_manager.delete_webhook(hook['id'])
+        except Exception:
+            logger.exception("Failed to clean up live test webhooks")
+    
+    def test_live_create_and_list_forwarding_address(self):
+        """Test creating and listing forwarding addresses."""
+        # Create a forwarding address
+        forwarding = self.forwarding_manager.create_forwarding_address(
+            destination=self.destination_address['address']
+        )
+        
+        # Verify the forwarding address was created
+        self.assertIn('input_address', forwarding)
+        self.assertEqual(forwarding['destination'], self.destination_address['address'])
+        
+        # Get the list of forwarding addresses
+        forwarding_list = self.forwarding_manager.list_forwarding_addresses()
+        
+        # Verify our forwarding address is in the list
+        found = False
+        for addr in forwarding_list:
+            if addr.get('id') == forwarding['id']:
+                found = True
+                break
+        
+        self.assertTrue(found, "Created forwarding address not found in list")
+        
+        # Clean up - delete the forwarding address
+        result = self.forwarding_manager.delete_forwarding_address(forwarding['id'])
+        self.assertTrue(result.get('deleted', False))
+    
+    def test_live_create_forwarding_with_fee(self):
+        """Test creating a forwarding address with a processing fee."""
+        # Create a forwarding address with a small processing fee
+        fee_satoshis = 1000  # 1000 satoshis (0.00001 BCY)
+        forwarding = self.forwarding_manager.create_forwarding_address(
+            destination=self.destination_address['address'],
+            processing_fee_satoshis=fee_satoshis
+        )
+        
+        # Verify the forwarding address was created with the fee
+        self.assertIn('input_address', forwarding)
+        self.assertEqual(forwarding['destination'], self.destination_address['address'])
+        self.assertIn('processing_fees', forwarding)
+        self.assertEqual(forwarding['processing_fees']['satoshis'], fee_satoshis)
+        
+        # Clean up
+        result = self.forwarding_manager.delete_forwarding_address(forwarding['id'])
+        self.assertTrue(result.get('deleted', False))
+    
+    def test_live_webhook_creation_and_management(self):
+        """Test creating, listing, and deleting webhooks."""
+        # Create a webhook for a transaction
+        webhook = self.forwarding_manager.create_webhook(
+            url=self.test_webhook_url,
+            event="unconfirmed-tx"
+        )
+        
+        # Verify the webhook was created
+        self.assertEqual(webhook['url'], self.test_webhook_url)
+        self.assertEqual(webhook['event'], "unconfirmed-tx")
+        
+        # Get the webhook by ID
+        retrieved_webhook = self.forwarding_manager.get_webhook(webhook['id'])
+        self.assertEqual(retrieved_webhook['id'], webhook['id'])
+        
+        # List webhooks and verify ours is included
+        webhook_list = self.forwarding_manager.list_webhooks()
+        found = False
+        for hook in webhook_list:
+            if hook.get('id') == webhook['id']:
+                found = True
+                break
+        
+        self.assertTrue(found, "Created webhook not found in list")
+        
+        # Delete the webhook
+        result = self.forwarding_manager.delete_webhook(webhook['id'])
+        self.assertTrue(result.get('deleted', False))
+    
+    def test_live_address_webhook(self):
+        """Test creating a webhook for a specific address."""
+        # Create an address-specific webhook
+        webhook = self.forwarding_manager.create_address_webhook(
+            url=self.test_webhook_url,
+            address=self.test_address['address']
+        )
+        
+        # Verify the webhook was created correctly
+        self.assertEqual(webhook['url'], self.test_webhook_url)
+        self.assertEqual(webhook['event'], "unconfirmed-tx")  # Default event
+        self.assertEqual(webhook['address'], self.test_address['address'])
+        
+        # Clean up
+        result = self.forwarding_manager.delete_webhook(webhook['id'])
+        self.assertTrue(result.get('deleted', False))
+    
+    def test_live_websocket_url(self):
+        """Test getting the WebSocket URL."""
+        # Get the WebSocket URL
+        ws_url = self.forwarding_manager.get_websocket_url()
+        
+        # Verify the URL format is correct
+        self.assertTrue(ws_url.startswith("wss://socket.blockcypher.com/v1/bcy/test"))
+        self.assertIn(f"token={self.api_token}", ws_url)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,475 +1,505 @@
 """
-Tests for the ForwardingManager class.
+Tests for the ForwardingManager and AsyncForwardingManager classes.
 """
 
-import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
+import httpx
+import orjson
 import pytest
-import os
+from requests.exceptions import RequestException
 
-from app.infrastructure.providers.blockcypher.forwarding import ForwardingManager
+from app.infrastructure.providers.blockcypher.common.exceptions import WebhookError
+from app.infrastructure.providers.blockcypher.common.rate_limit import AsyncRateLimiter
+from app.infrastructure.providers.blockcypher.forwarding import AsyncForwardingManager, ForwardingManager
+from app.infrastructure.providers.blockcypher.forwarding.manager import FORWARDING_PAGE_SIZE
 
-class TestForwardingManager(unittest.TestCase):
-    """Tests for the ForwardingManager class."""
+@pytest.fixture(scope="module")
+def shared_forwarding_manager():
+    """Build the manager once for every mocked test in the module."""
+    return ForwardingManager(api_token="test_token", coin_symbol="btc-testnet")
+
+@pytest.fixture
+def forwarding_manager(shared_forwarding_manager):
+    """Provide the shared manager with empty caches."""
+    shared_forwarding_manager._webhook_cache.clear()
+    shared_forwarding_manager._list_cache.clear()
+    return shared_forwarding_manager
+
+@pytest.fixture
+def mock_make_request():
+    """Patch BlockCypherProvider.make_request for one test."""
+    with patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request') as mock:
+        yield mock
+
+@pytest.fixture
+def mock_get_json():
+    """Patch BlockCypherProvider._get_json, used for listings and lookups, for one test."""
+    with patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider._get_json') as mock:
+        yield mock
+
+@pytest.fixture
+def mock_create_webhook():
+    """Patch ForwardingManager.create_webhook for one test."""
+    with patch('app.infrastructure.providers.blockcypher.forwarding.manager.ForwardingManager.create_webhook') as mock:
+        yield mock
+
+@pytest.mark.parametrize("kwargs, expected_data", [
+    (
+        {"callback_url": "https://example.com/callback", "transaction_url": "https://example.com/tx"},
+        {"callback_url": "https://example.com/callback", "transaction_url": "https://example.com/tx"},
+    ),
+    # The processing fee is sent in BlockCypher's nested format
+    (
+        {"callback_url": "https://example.com/callback", "transaction_url": "https://example.com/tx", "processing_fee_satoshis": 10000},
+        {"callback_url": "https://example.com/callback", "transaction_url": "https://example.com/tx", "processing_fees": {"satoshis": 10000}},
+    ),
+    # Zero values are sent while None values are left out
+    (
+        {"callback_url": None, "processing_fee_satoshis": 0},
+        {"processing_fees": {"satoshis": 0}},
+    ),
+])
+def test_create_forwarding_address(mock_make_request, forwarding_manager, kwargs, expected_data):
+    """Test creating a forwarding address."""
+    # Mock response
+    mock_make_request.return_value = {"id": "forwarding_id_123", "input_address": "tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx"}
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.api_token = "test_token"
-        self.forwarding_manager = ForwardingManager(api_token=self.api_token, coin_symbol="btc-testnet")
+    # Call the method
+    result = forwarding_manager.create_forwarding_address(destination="tb1qejxtdg4y5r3zarvary0c5xw7kx508d6q3jzsx", **kwargs)
     
-    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
-    def test_create_forwarding_address(self, mock_make_request):
-        """Test creating a forwarding address."""
-        # Mock response
-        mock_response = {
+    # Assertions
+    mock_make_request.assert_called_once_with(
+        'POST',
+        'payments',
+        data={"destination": "tb1qejxtdg4y5r3zarvary0c5xw7kx508d6q3jzsx", **expected_data}
+    )
+    assert result == mock_make_request.return_value
+
+def test_list_forwarding_addresses(mock_get_json, forwarding_manager):
+    """Test listing forwarding addresses."""
+    # Mock response
+    mock_response = [
+        {
             "id": "forwarding_id_123",
-            "token": "test_token",
             "input_address": "tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx",
-            "destination": "tb1qejxtdg4y5r3zarvary0c5xw7kx508d6q3jzsx",
-            "callback_url": "https://example.com/callback",
-            "transaction_url": "https://example.com/tx"
+            "destination": "tb1qejxtdg4y5r3zarvary0c5xw7kx508d6q3jzsx"
+        },
+        {
+            "id": "forwarding_id_456",
+            "input_address": "tb1qnkrer6qnrqdznq0207z2rf2vh3zg0n92j9thsk",
+            "destination": "tb1qejxtdg4y5r3zarvary0c5xw7kx508d6q3jzsx"
         }
-        mock_make_request.return_value = mock_response
-        
-        # Call the method
-        result = self.forwarding_manager.create_forwarding_address(
-            destination="tb1qejxtdg4y5r3zarvary0c5xw7kx508d6q3jzsx",
-            callback_url="https://example.com/callback",
-            transaction_url="https://example.com/tx"
-        )
-        
-        # Assertions
-        mock_make_request.assert_called_once_with(
-            'POST', 
-            'payments', 
-            data={
-                "destination": "tb1qejxtdg4y5r3zarvary0c5xw7kx508d6q3jzsx",
-                "callback_url": "https://example.com/callback",
-                "transaction_url": "https://example.com/tx"
-            }
-        )
-        self.assertEqual(result, mock_response)
+    ]
+    mock_get_json.return_value = mock_response
     
-    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
-    def test_create_forwarding_address_with_fee(self, mock_make_request):
-        """Test creating a forwarding address with a processing fee."""
-        # Mock response
-        mock_response = {
-            "id": "forwarding_id_123",
-            "token": "test_token",
-            "input_address": "tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx",
-            "destination": "tb1qejxtdg4y5r3zarvary0c5xw7kx508d6q3jzsx",
-            "callback_url": "https://example.com/callback",
-            "transaction_url": "https://example.com/tx",
-            "processing_fees": {
-                "satoshis": 10000
-            }
-        }
-        mock_make_request.return_value = mock_response
-        
-        # Call the method
-        result = self.forwarding_manager.create_forwarding_address(
-            destination="tb1qejxtdg4y5r3zarvary0c5xw7kx508d6q3jzsx",
-            callback_url="https://example.com/callback",
-            transaction_url="https://example.com/tx",
-            processing_fee_satoshis=10000
-        )
-        
-        # Assertions
-        mock_make_request.assert_called_once_with(
-            'POST', 
-            'payments', 
-            data={
-                "destination": "tb1qejxtdg4y5r3zarvary0c5xw7kx508d6q3jzsx",
-                "callback_url": "https://example.com/callback",
-                "transaction_url": "https://example.com/tx",
-                "processing_fees": {
-                    "satoshis": 10000
-                }
-            }
-        )
-        self.assertEqual(result, mock_response)
-    
-    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
-    def test_list_forwarding_addresses(self, mock_make_request):
-        """Test listing forwarding addresses."""
-        # Mock response
-        mock_response = [
-            {
-                "id": "forwarding_id_123",
-                "input_address": "tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx",
-                "destination": "tb1qejxtdg4y5r3zarvary0c5xw7kx508d6q3jzsx"
-            },
-            {
-                "id": "forwarding_id_456",
-                "input_address": "tb1qnkrer6qnrqdznq0207z2rf2vh3zg0n92j9thsk",
-                "destination": "tb1qejxtdg4y5r3zarvary0c5xw7kx508d6q3jzsx"
-            }
-        ]
-        mock_make_request.return_value = mock_response
-        
-        # Call the method
-        result = self.forwarding_manager.list_forwarding_addresses()
-        
-        # Assertions
-        mock_make_request.assert_called_once_with('GET', 'payments')
-        self.assertEqual(result, mock_response)
-        self.assertEqual(len(result), 2)
-    
-    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
-    def test_delete_forwarding_address(self, mock_make_request):
-        """Test deleting a forwarding address."""
-        # Mock response
-        mock_response = {"deleted": True}
-        mock_make_request.return_value = mock_response
-        
-        # Call the method
-        result = self.forwarding_manager.delete_forwarding_address("forwarding_id_123")
-        
-        # Assertions
-        mock_make_request.assert_called_once_with('DELETE', 'payments/forwarding_id_123')
-        self.assertEqual(result, mock_response)
-    
-    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
-    def test_create_webhook(self, mock_make_request):
-        """Test creating a webhook."""
-        # Mock response
-        mock_response = {
-            "id": "webhook_id_123",
-            "token": "test_token",
+    # Call the method
+    result = forwarding_manager.list_forwarding_addresses()
+    
+    # Assertions
+    mock_get_json.assert_called_once_with('payments')
+    assert result == mock_response
+    assert len(result) == 2
+
+def test_iter_forwarding_addresses_paginates(mock_get_json, forwarding_manager):
+    """Test that full API pages are followed until a short page comes back."""
+    # Mock response: two full pages, then a partial page
+    entries = [{"id": f"fwd_{i}"} for i in range(2 * FORWARDING_PAGE_SIZE + 1)]
+    mock_get_json.side_effect = lambda endpoint, params=None: (
+        entries[(params or {}).get('start', 0):][:FORWARDING_PAGE_SIZE]
+    )
+    
+    # Call the method
+    result = list(forwarding_manager.iter_forwarding_addresses())
+    
+    # Assertions
+    assert result == entries
+    assert mock_get_json.call_count == 3
+    mock_get_json.assert_called_with('payments', params={'start': 2 * FORWARDING_PAGE_SIZE})
+
+def test_delete_forwarding_address(mock_make_request, forwarding_manager):
+    """Test deleting a forwarding address."""
+    # Mock response
+    mock_response = {"deleted": True}
+    mock_make_request.return_value = mock_response
+    
+    # Call the method
+    result = forwarding_manager.delete_forwarding_address("forwarding_id_123")
+    
+    # Assertions
+    mock_make_request.assert_called_once_with('DELETE', 'payments/forwarding_id_123')
+    assert result == mock_response
+
+def test_create_webhook(mock_make_request, forwarding_manager):
+    """Test creating a webhook."""
+    # Mock response
+    mock_response = {
+        "id": "webhook_id_123",
+        "token": "test_token",
+        "url": "https://example.com/webhook",
+        "event": "confirmed-tx"
+    }
+    mock_make_request.return_value = mock_response
+    
+    # Call the method
+    result = forwarding_manager.create_webhook(
+        url="https://example.com/webhook",
+        event="confirmed-tx"
+    )
+    
+    # Assertions
+    mock_make_request.assert_called_once_with(
+        'POST', 
+        'hooks', 
+        data={
             "url": "https://example.com/webhook",
             "event": "confirmed-tx"
         }
-        mock_make_request.return_value = mock_response
-        
-        # Call the method
-        result = self.forwarding_manager.create_webhook(
+    )
+    assert result == mock_response
+
+def test_create_webhook_invalid_event(mock_make_request, forwarding_manager):
+    """Test creating a webhook with an invalid event type."""
+    # Call the method with an invalid event type
+    with pytest.raises(ValueError) as context:
+        forwarding_manager.create_webhook(
             url="https://example.com/webhook",
-            event="confirmed-tx"
+            event="invalid-event"
         )
-        
-        # Assertions
-        mock_make_request.assert_called_once_with(
-            'POST', 
-            'hooks', 
-            data={
-                "url": "https://example.com/webhook",
-                "event": "confirmed-tx"
-            }
-        )
-        self.assertEqual(result, mock_response)
-    
-    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
-    def test_create_webhook_invalid_event(self, mock_make_request):
-        """Test creating a webhook with an invalid event type."""
-        # Call the method with an invalid event type
-        with self.assertRaises(ValueError) as context:
-            self.forwarding_manager.create_webhook(
-                url="https://example.com/webhook",
-                event="invalid-event"
-            )
-        
-        # Verify error message
-        self.assertTrue("not a valid event type" in str(context.exception))
-        
-        # Verify no request was made
-        mock_make_request.assert_not_called()
-    
-    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
-    def test_list_webhooks(self, mock_make_request):
-        """Test listing webhooks."""
-        # Mock response
-        mock_response = [
-            {
-                "id": "webhook_id_123",
-                "url": "https://example.com/webhook1",
-                "event": "confirmed-tx"
-            },
-            {
-                "id": "webhook_id_456",
-                "url": "https://example.com/webhook2",
-                "event": "tx-confirmation"
-            }
-        ]
-        mock_make_request.return_value = mock_response
-        
-        # Call the method
-        result = self.forwarding_manager.list_webhooks()
-        
-        # Assertions
-        mock_make_request.assert_called_once_with('GET', 'hooks')
-        self.assertEqual(result, mock_response)
-        self.assertEqual(len(result), 2)
-    
-    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
-    def test_get_webhook(self, mock_make_request):
-        """Test getting a webhook."""
-        # Mock response
-        mock_response = {
+    
+    # Verify error message
+    assert "not a valid event type" in str(context.value)
+    
+    # Verify no request was made
+    mock_make_request.assert_not_called()
+
+def test_list_webhooks(mock_get_json, forwarding_manager):
+    """Test listing webhooks."""
+    # Mock response
+    mock_response = [
+        {
             "id": "webhook_id_123",
-            "url": "https://example.com/webhook",
+            "url": "https://example.com/webhook1",
             "event": "confirmed-tx"
+        },
+        {
+            "id": "webhook_id_456",
+            "url": "https://example.com/webhook2",
+            "event": "tx-confirmation"
         }
-        mock_make_request.return_value = mock_response
-        
-        # Call the method
-        result = self.forwarding_manager.get_webhook("webhook_id_123")
-        
-        # Assertions
-        mock_make_request.assert_called_once_with('GET', 'hooks/webhook_id_123')
-        self.assertEqual(result, mock_response)
-    
-    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
-    def test_delete_webhook(self, mock_make_request):
-        """Test deleting a webhook."""
-        # Mock response
-        mock_response = {"deleted": True}
-        mock_make_request.return_value = mock_response
-        
-        # Call the method
-        result = self.forwarding_manager.delete_webhook("webhook_id_123")
-        
-        # Assertions
-        mock_make_request.assert_called_once_with('DELETE', 'hooks/webhook_id_123')
-        self.assertEqual(result, mock_response)
-    
-    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
-    def test_get_websocket_url(self, mock_make_request):
-        """Test getting a WebSocket URL."""
-        # Call the method
-        result = self.forwarding_manager.get_websocket_url()
-        
-        # Assertions
-        self.assertTrue(result.startswith("wss://socket.blockcypher.com/v1/btc/test3?token="))
-    
-    @patch('app.infrastructure.providers.blockcypher.forwarding.manager.ForwardingManager.create_webhook')
-    def test_create_address_webhook(self, mock_create_webhook):
-        """Test creating a webhook for an address."""
-        # Mock response
-        mock_create_webhook.return_value = {
-            "id": "webhook_id_123",
-            "url": "https://example.com/webhook",
-            "event": "unconfirmed-tx",
-            "address": "tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx"
-        }
-        
-        # Call the method
-        result = self.forwarding_manager.create_address_webhook(
-            url="https://example.com/webhook",
-            address="tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx",
-            event="unconfirmed-tx"
-        )
-        
-        # Assertions
-        mock_create_webhook.assert_called_once_with(
-            url="https://example.com/webhook",
-            event="unconfirmed-tx",
-            address="tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx",
-            filter=None
-        )
-        self.assertEqual(result, mock_create_webhook.return_value)
+    ]
+    mock_get_json.return_value = mock_response
     
-    @patch('app.infrastructure.providers.blockcypher.forwarding.manager.ForwardingManager.create_webhook')
-    def test_create_transaction_webhook(self, mock_create_webhook):
-        """Test creating a webhook for a transaction."""
-        # Mock response
-        mock_create_webhook.return_value = {
-            "id": "webhook_id_123",
-            "url": "https://example.com/webhook",
-            "event": "confirmed-tx",
-            "hash": "tx_hash_123"
-        }
-        
-        # Call the method
-        result = self.forwarding_manager.create_transaction_webhook(
-            url="https://example.com/webhook",
-            transaction_hash="tx_hash_123",
-            confirmations=6
-        )
-        
-        # Assertions
-        mock_create_webhook.assert_called_once_with(
-            url="https://example.com/webhook",
-            event="tx-confirmation",
-            hash="tx_hash_123",
-            confirmations=6
-        )
-        self.assertEqual(result, mock_create_webhook.return_value)
+    # Call the method
+    result = forwarding_manager.list_webhooks()
     
-    @patch('app.infrastructure.providers.blockcypher.forwarding.manager.ForwardingManager.create_webhook')
-    def test_create_confidence_webhook(self, mock_create_webhook):
-        """Test creating a webhook for confidence monitoring."""
-        # Mock response
-        mock_create_webhook.return_value = {
-            "id": "webhook_id_123",
-            "url": "https://example.com/webhook",
-            "event": "tx-confidence",
-            "hash": "tx_hash_123",
-            "confidence": 0.9
-        }
-        
-        # Call the method
-        result = self.forwarding_manager.create_confidence_webhook(
-            url="https://example.com/webhook",
-            transaction_hash="tx_hash_123",
-            confidence=0.9
-        )
-        
-        # Assertions
-        mock_create_webhook.assert_called_once_with(
-            url="https://example.com/webhook",
-            event="tx-confidence",
-            hash="tx_hash_123",
-            confidence=0.9
-        )
-        self.assertEqual(result, mock_create_webhook.return_value)
-
-
-# Real tests using the BlockCypher test faucet
-# These tests will only run if the BLOCKCYPHER_LIVE_TEST environment variable is set to 'true'
-@pytest.mark.skipif(
-    os.getenv("BLOCKCYPHER_LIVE_TEST") != "true",
-    reason="Live tests only run when BLOCKCYPHER_LIVE_TEST=true"
-)
-class TestForwardingManagerWithFaucet(unittest.TestCase):
-    """Tests for the ForwardingManager class using the test faucet."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        from app.infrastructure.providers.blockcypher.utils.test_utils import (
-            get_test_api_token,
-            setup_funded_test_address,
-            generate_test_address
-        )
-        
-        self.coin_symbol = 'bcy'  # BlockCypher test chain
-        self.api_token = get_test_api_token()
-        self.forwarding_manager = ForwardingManager(api_token=self.api_token, coin_symbol=self.coin_symbol)
-        
-        # Generate a funded address for testing
-        funded_setup = setup_funded_test_address(coin_symbol=self.coin_symbol)
-        self.test_address = funded_setup['address_info']
-        self.funding_tx = funded_setup['funding_tx']
-        
-        # Create another address to use as destination
-        self.destination_address = generate_test_address(coin_symbol=self.coin_symbol)
-        
-        # Test webhook URL (This is just for testing - in real usage you'd use a public URL)
-        self.test_webhook_url = "https://webhook.site/your-unique-id"
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        # Try to clean up any created webhooks
-        try:
-            webhooks = self.forwarding_manager.list_webhooks()
-            for hook in webhooks:
-                if hook.get('url') == self.test_webhook_url:
-                    self.forwarding_manager.delete_webhook(hook['id'])
-        except:
-            pass
-    
-    def test_live_create_and_list_forwarding_address(self):
-        """Test creating and listing forwarding addresses."""
-        # Create a forwarding address
-        forwarding = self.forwarding_manager.create_forwarding_address(
-            destination=self.destination_address['address']
-        )
-        
-        # Verify the forwarding address was created
-        self.assertIn('input_address', forwarding)
-        self.assertEqual(forwarding['destination'], self.destination_address['address'])
-        
-        # Get the list of forwarding addresses
-        forwarding_list = self.forwarding_manager.list_forwarding_addresses()
-        
-        # Verify our forwarding address is in the list
-        found = False
-        for addr in forwarding_list:
-            if addr.get('id') == forwarding['id']:
-                found = True
-                break
-        
-        self.assertTrue(found, "Created forwarding address not found in list")
-        
-        # Clean up - delete the forwarding address
-        result = self.forwarding_manager.delete_forwarding_address(forwarding['id'])
-        self.assertTrue(result.get('deleted', False))
-    
-    def test_live_create_forwarding_with_fee(self):
-        """Test creating a forwarding address with a processing fee."""
-        # Create a forwarding address with a small processing fee
-        fee_satoshis = 1000  # 1000 satoshis (0.00001 BCY)
-        forwarding = self.forwarding_manager.create_forwarding_address(
-            destination=self.destination_address['address'],
-            processing_fee_satoshis=fee_satoshis
-        )
-        
-        # Verify the forwarding address was created with the fee
-        self.assertIn('input_address', forwarding)
-        self.assertEqual(forwarding['destination'], self.destination_address['address'])
-        self.assertIn('processing_fees', forwarding)
-        self.assertEqual(forwarding['processing_fees']['satoshis'], fee_satoshis)
-        
-        # Clean up
-        result = self.forwarding_manager.delete_forwarding_address(forwarding['id'])
-        self.assertTrue(result.get('deleted', False))
-    
-    def test_live_webhook_creation_and_management(self):
-        """Test creating, listing, and deleting webhooks."""
-        # Create a webhook for a transaction
-        webhook = self.forwarding_manager.create_webhook(
-            url=self.test_webhook_url,
-            event="unconfirmed-tx"
-        )
-        
-        # Verify the webhook was created
-        self.assertEqual(webhook['url'], self.test_webhook_url)
-        self.assertEqual(webhook['event'], "unconfirmed-tx")
-        
-        # Get the webhook by ID
-        retrieved_webhook = self.forwarding_manager.get_webhook(webhook['id'])
-        self.assertEqual(retrieved_webhook['id'], webhook['id'])
-        
-        # List webhooks and verify ours is included
-        webhook_list = self.forwarding_manager.list_webhooks()
-        found = False
-        for hook in webhook_list:
-            if hook.get('id') == webhook['id']:
-                found = True
-                break
-        
-        self.assertTrue(found, "Created webhook not found in list")
-        
-        # Delete the webhook
-        result = self.forwarding_manager.delete_webhook(webhook['id'])
-        self.assertTrue(result.get('deleted', False))
-    
-    def test_live_address_webhook(self):
-        """Test creating a webhook for a specific address."""
-        # Create an address-specific webhook
-        webhook = self.forwarding_manager.create_address_webhook(
-            url=self.test_webhook_url,
-            address=self.test_address['address']
-        )
-        
-        # Verify the webhook was created correctly
-        self.assertEqual(webhook['url'], self.test_webhook_url)
-        self.assertEqual(webhook['event'], "unconfirmed-tx")  # Default event
-        self.assertEqual(webhook['address'], self.test_address['address'])
-        
-        # Clean up
-        result = self.forwarding_manager.delete_webhook(webhook['id'])
-        self.assertTrue(result.get('deleted', False))
-    
-    def test_live_websocket_url(self):
-        """Test getting the WebSocket URL."""
-        # Get the WebSocket URL
-        ws_url = self.forwarding_manager.get_websocket_url()
-        
-        # Verify the URL format is correct
-        self.assertTrue(ws_url.startswith("wss://socket.blockcypher.com/v1/bcy/test"))
-        self.assertIn(f"token={self.api_token}", ws_url)
-
-
-if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+    # Assertions
+    mock_get_json.assert_called_once_with('hooks')
+    assert result == mock_response
+    assert len(result) == 2
+
+def test_get_webhook(mock_get_json, forwarding_manager):
+    """Test getting a webhook."""
+    # Mock response
+    mock_response = {
+        "id": "webhook_id_123",
+        "url": "https://example.com/webhook",
+        "event": "confirmed-tx"
+    }
+    mock_get_json.return_value = mock_response
+    
+    # Call the method
+    result = forwarding_manager.get_webhook("webhook_id_123")
+    
+    # Assertions
+    mock_get_json.assert_called_once_with('hooks/webhook_id_123')
+    assert result == mock_response
+
+def test_list_webhooks_is_cached_until_created(mock_get_json, mock_make_request, forwarding_manager):
+    """Test that the webhook listing is reused until a webhook is created."""
+    # Mock response
+    mock_get_json.return_value = [{"id": "webhook_id_123"}]
+    mock_make_request.return_value = {"id": "webhook_id_456"}
+    
+    # Call the method
+    first = forwarding_manager.list_webhooks()
+    forwarding_manager.list_webhooks()
+    forwarding_manager.create_webhook(url="https://example.com/webhook", event="new-block")
+    forwarding_manager.list_webhooks()
+    
+    # Assertions
+    assert first == [{"id": "webhook_id_123"}]
+    assert mock_get_json.call_count == 2
+
+def test_get_webhook_is_cached_until_deleted(mock_get_json, mock_make_request, forwarding_manager):
+    """Test that repeat lookups are served from cache and deletion invalidates them."""
+    # Mock response
+    mock_get_json.return_value = {"id": "webhook_id_123", "event": "unconfirmed-tx"}
+    mock_make_request.return_value = {}
+    
+    # Call the method
+    first = forwarding_manager.get_webhook("webhook_id_123")
+    second = forwarding_manager.get_webhook("webhook_id_123")
+    forwarding_manager.delete_webhook("webhook_id_123")
+    forwarding_manager.get_webhook("webhook_id_123")
+    
+    # Assertions
+    assert first == second
+    assert mock_get_json.call_count == 2
+
+def test_failed_create_keeps_webhook_listing_cached(mock_get_json, mock_make_request, forwarding_manager):
+    """Test that a failed write does not invalidate the cached listing."""
+    # Mock response: the POST fails
+    mock_get_json.return_value = [{"id": "webhook_id_123"}]
+    mock_make_request.side_effect = RequestException("503 Service Unavailable")
+    
+    # Call the method
+    forwarding_manager.list_webhooks()
+    with pytest.raises(WebhookError):
+        forwarding_manager.create_webhook(url="https://example.com/webhook", event="new-block")
+    forwarding_manager.list_webhooks()
+    
+    # Assertions
+    assert mock_get_json.call_count == 1
+
+def test_cached_results_are_copies(mock_get_json, forwarding_manager):
+    """Test that changing a returned entry does not change what the cache serves."""
+    # Mock response
+    mock_get_json.return_value = [{"id": "webhook_id_123", "filter": {"confirmations": 6}}]
+    
+    # Call the method
+    first = forwarding_manager.list_webhooks()
+    first[0]["filter"]["confirmations"] = 1
+    second = forwarding_manager.list_webhooks()
+    
+    # Assertions
+    assert second == [{"id": "webhook_id_123", "filter": {"confirmations": 6}}]
+    assert mock_get_json.call_count == 1
+
+def test_delete_webhook(mock_make_request, forwarding_manager):
+    """Test deleting a webhook."""
+    # Mock response
+    mock_response = {"deleted": True}
+    mock_make_request.return_value = mock_response
+    
+    # Call the method
+    result = forwarding_manager.delete_webhook("webhook_id_123")
+    
+    # Assertions
+    mock_make_request.assert_called_once_with('DELETE', 'hooks/webhook_id_123')
+    assert result == mock_response
+
+def test_delete_webhook_failure_chains_cause(mock_make_request, forwarding_manager):
+    """Test that a failed request surfaces as WebhookError with the cause chained."""
+    # Mock response
+    cause = RequestException("404 Not Found")
+    mock_make_request.side_effect = cause
+    
+    # Call the method
+    with pytest.raises(WebhookError) as context:
+        forwarding_manager.delete_webhook("webhook_id_123")
+    
+    # Assertions
+    assert context.value.__cause__ is cause
+    assert "Failed to delete webhook webhook_id_123" in str(context.value)
+
+def test_create_webhooks_batch(mock_make_request, forwarding_manager):
+    """Test creating several webhooks, keeping the order of the specs."""
+    # Mock response: echo the request body with an ID
+    mock_make_request.side_effect = lambda method, endpoint, data: {"id": f"hook_{data['address']}", **data}
+    
+    # Call the method
+    result = forwarding_manager.create_webhooks_batch([
+        {"url": "https://example.com/1", "event": "unconfirmed-tx", "address": "addr1"},
+        {"url": "https://example.com/2", "event": "confirmed-tx", "address": "addr2"},
+    ])
+    
+    # Assertions
+    assert [hook["id"] for hook in result] == ["hook_addr1", "hook_addr2"]
+    assert result[1]["event"] == "confirmed-tx"
+    assert mock_make_request.call_count == 2
+
+def test_create_webhooks_batch_validates_first(mock_make_request, forwarding_manager):
+    """Test that one invalid spec stops the batch before any request is sent."""
+    with pytest.raises(ValueError):
+        forwarding_manager.create_webhooks_batch([
+            {"url": "https://example.com/1", "event": "unconfirmed-tx", "address": "addr1"},
+            {"url": "https://example.com/2", "event": "bogus", "address": "addr2"},
+        ])
+    
+    mock_make_request.assert_not_called()
+
+def test_create_transaction_webhooks_batch(mock_make_request, forwarding_manager):
+    """Test creating confirmation webhooks for several transactions, keeping their order."""
+    # Mock response: echo the request body with an ID
+    mock_make_request.side_effect = lambda method, endpoint, data: {"id": f"hook_{data['hash']}", **data}
+    
+    # Call the method
+    result = forwarding_manager.create_transaction_webhooks_batch([
+        ("https://example.com/1", "tx1", 1),
+        ("https://example.com/2", "tx2", 6),
+    ])
+    
+    # Assertions
+    assert [hook["id"] for hook in result] == ["hook_tx1", "hook_tx2"]
+    assert [hook["confirmations"] for hook in result] == [1, 6]
+    assert all(hook["event"] == "tx-confirmation" for hook in result)
+
+def test_bulk_delete_webhooks(mock_make_request, forwarding_manager):
+    """Test that bulk deletion reports failures per ID instead of aborting."""
+    # Mock response: the second deletion fails
+    def delete(method, endpoint):
+        if endpoint == 'hooks/hook_2':
+            raise RequestException("404 Not Found")
+        return {}
+    mock_make_request.side_effect = delete
+    
+    # Call the method
+    result = forwarding_manager.bulk_delete_webhooks(["hook_1", "hook_2", "hook_3"])
+    
+    # Assertions
+    assert result == {"hook_1": True, "hook_2": False, "hook_3": True}
+    assert mock_make_request.call_count == 3
+
+def test_get_websocket_url(forwarding_manager):
+    """Test getting a WebSocket URL."""
+    # Call the method
+    result = forwarding_manager.get_websocket_url()
+    
+    # Assertions
+    assert result.startswith("wss://socket.blockcypher.com/v1/btc/test3?token=")
+
+@pytest.mark.parametrize("method, kwargs, expected_call", [
+    (
+        "create_address_webhook",
+        {"url": "https://example.com/webhook", "address": "tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx", "event": "unconfirmed-tx"},
+        {"url": "https://example.com/webhook", "event": "unconfirmed-tx", "address": "tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx", "filter": None},
+    ),
+    # Extra parameters are passed on
+    (
+        "create_address_webhook",
+        {"url": "https://example.com/webhook", "address": "tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx", "script": "pay-to-pubkey-hash"},
+        {"url": "https://example.com/webhook", "event": "unconfirmed-tx", "address": "tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx", "filter": None, "script": "pay-to-pubkey-hash"},
+    ),
+    (
+        "create_transaction_webhook",
+        {"url": "https://example.com/webhook", "transaction_hash": "tx_hash_123", "confirmations": 6},
+        {"url": "https://example.com/webhook", "event": "tx-confirmation", "hash": "tx_hash_123", "confirmations": 6},
+    ),
+    (
+        "create_confidence_webhook",
+        {"url": "https://example.com/webhook", "transaction_hash": "tx_hash_123", "confidence": 0.9},
+        {"url": "https://example.com/webhook", "event": "tx-confidence", "hash": "tx_hash_123", "confidence": 0.9},
+    ),
+    # The transaction alias is sent as the hash BlockCypher expects
+    (
+        "create_transaction_webhook",
+        {"url": "https://example.com/webhook", "transaction": "abc123", "confirmations": 3},
+        {"url": "https://example.com/webhook", "event": "tx-confirmation", "hash": "abc123", "confirmations": 3},
+    ),
+    (
+        "create_confidence_webhook",
+        {"url": "https://example.com/webhook", "transaction": "abc123", "confidence": 0.95},
+        {"url": "https://example.com/webhook", "event": "tx-confidence", "hash": "abc123", "confidence": 0.95},
+    ),
+])
+def test_webhook_helpers_delegate_to_create_webhook(mock_create_webhook, forwarding_manager, method, kwargs, expected_call):
+    """Test that each webhook helper fills in its event and calls create_webhook."""
+    # Mock response
+    mock_create_webhook.return_value = {"id": "webhook_id_123"}
+    
+    # Call the method
+    result = getattr(forwarding_manager, method)(**kwargs)
+    
+    # Assertions
+    mock_create_webhook.assert_called_once_with(**expected_call)
+    assert result == mock_create_webhook.return_value
+
+@pytest.fixture
+def anyio_backend():
+    """Run the async tests on asyncio."""
+    return "asyncio"
+
+@pytest.fixture
+def sent_requests():
+    """Requests received by the mock BlockCypher API."""
+    return []
+
+@pytest.fixture
+async def async_forwarding_manager(sent_requests):
+    """Provide an async manager whose client talks to a mock BlockCypher API."""
+    def handle(request):
+        # Answer webhook and forwarding calls like the BlockCypher API would
+        sent_requests.append(request)
+        if request.method == 'DELETE':
+            return httpx.Response(204)
+        body = orjson.loads(request.content)
+        resource = body.get('address') or body.get('hash') or body.get('destination')
+        return httpx.Response(201, json={"id": f"id_{resource}", **body})
+    
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handle)) as client:
+        yield AsyncForwardingManager(api_token="test_token", client=client, rate_limiter=AsyncRateLimiter(max_rate=1000))
+
+@pytest.mark.anyio
+async def test_async_create_address_webhooks(async_forwarding_manager, sent_requests):
+    """Test that several address webhooks are created concurrently, in order."""
+    result = await async_forwarding_manager.create_address_webhooks([
+        ("addr1", "https://example.com/1"),
+        ("addr2", "https://example.com/2"),
+    ])
+    
+    # Assertions
+    assert [hook["id"] for hook in result] == ["id_addr1", "id_addr2"]
+    assert result[1]["url"] == "https://example.com/2"
+    assert result[1]["event"] == "unconfirmed-tx"
+    assert len(sent_requests) == 2
+    assert sent_requests[0].url.params["token"] == "test_token"
+
+@pytest.mark.anyio
+async def test_async_create_address_webhook_passes_extra_parameters(async_forwarding_manager):
+    """Test that extra keyword arguments reach the request body."""
+    result = await async_forwarding_manager.create_address_webhook(
+        url="https://example.com/webhook", address="addr1", script="pay-to-pubkey-hash"
+    )
+    
+    # Assertions
+    assert result["script"] == "pay-to-pubkey-hash"
+
+@pytest.mark.anyio
+async def test_async_create_transaction_webhook(async_forwarding_manager):
+    """Test that the transaction alias is sent as the hash field."""
+    result = await async_forwarding_manager.create_transaction_webhook(
+        url="https://example.com/webhook", transaction="tx_hash_123", confirmations=3
+    )
+    
+    # Assertions
+    assert result["event"] == "tx-confirmation"
+    assert result["hash"] == "tx_hash_123"
+    assert result["confirmations"] == 3
+
+@pytest.mark.anyio
+async def test_async_create_forwarding_addresses(async_forwarding_manager, sent_requests):
+    """Test that several forwarding addresses are created concurrently, in order."""
+    result = await async_forwarding_manager.create_forwarding_addresses(
+        ["dest1", "dest2"], callback_url="https://example.com/callback"
+    )
+    
+    # Assertions
+    assert [forward["id"] for forward in result] == ["id_dest1", "id_dest2"]
+    assert all(request.url.path.endswith("/payments") for request in sent_requests)
+
+@pytest.mark.anyio
+async def test_async_create_webhook_invalid_event(async_forwarding_manager, sent_requests):
+    """Test that an invalid event type is rejected before any request."""
+    with pytest.raises(ValueError):
+        await async_forwarding_manager.create_webhook(url="https://example.com/webhook", event="bogus")
+    
+    assert sent_requests == []
+
+@pytest.mark.anyio
+async def test_async_delete_webhook(async_forwarding_manager, sent_requests):
+    """Test deleting a webhook with an empty response body."""
+    result = await async_forwarding_manager.delete_webhook("hook_123")
+    
+    # Assertions
+    assert result == {}
+    assert sent_requests[0].url.path == "/v1/btc/test3/hooks/hook_123"
@@ -6,7 +6,13 @@ import unittest
 from unittest.mock import patch, MagicMock
 import warnings
 
-from app.infrastructure.providers.blockcypher.blockchain import BlockchainService
+import httpx
+import requests
+from requests.exceptions import HTTPError
+
+from app.infrastructure.providers.blockcypher.blockchain import AsyncBlockchainService, BlockchainService, _warn_deprecated
+from app.infrastructure.providers.blockcypher.common.exceptions import BlockCypherError
+from app.infrastructure.providers.blockcypher.common.rate_limit import AsyncRateLimiter
 
 class TestBlockchainService(unittest.TestCase):
     """Tests for the BlockchainService class."""
@@ -15,22 +21,26 @@ class TestBlockchainService(unittest.TestCase):
         """Set up test fixtures."""
         self.api_token = "test_token"
         self.blockchain_service = BlockchainService(api_token=self.api_token, coin_symbol="btc-testnet")
+        # Deprecation warnings are emitted once per process; reset so each test sees them
+        _warn_deprecated.cache_clear()
+        # Network parameters are cached across instances; start each test cold
+        BlockchainService._network_params_cache.clear()
     
-    @patch('blockcypher.get_latest_block_height')
-    def test_get_latest_block_height(self, mock_get_latest_block_height):
+    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
+    def test_get_latest_block_height(self, mock_make_request):
         """Test getting the latest block height."""
         # Mock response
-        mock_get_latest_block_height.return_value = 680000
+        mock_make_request.return_value = {"name": "BTC.test3", "height": 680000}
         
         # Call the method
         result = self.blockchain_service.get_latest_block_height()
         
         # Assertions
-        mock_get_latest_block_height.assert_called_once_with(coin_symbol="btc-testnet")
+        mock_make_request.assert_called_once_with('GET', '')
         self.assertEqual(result, 680000)
     
-    @patch('blockcypher.get_block_details')
-    def test_get_block_details(self, mock_get_block_details):
+    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
+    def test_get_block_details(self, mock_make_request):
         """Test getting block details."""
         # Mock response
         mock_response = {
@@ -46,13 +56,13 @@ class TestBlockchainService(unittest.TestCase):
             "mrkl_root": "4a5e1e4baab89f3a32518a88c31bc87f618f76673e2cc77ab2127b7afdeda33b",
             "txids": ["tx1", "tx2", "tx3"]
         }
-        mock_get_block_details.return_value = mock_response
+        mock_make_request.return_value = mock_response
         
         # Call the method
         result = self.blockchain_service.get_block_details(680000)
         
         # Assertions
-        mock_get_block_details.assert_called_once_with(680000, coin_symbol="btc-testnet")
+        mock_make_request.assert_called_once_with('GET', 'blocks/680000')
         self.assertEqual(result["hash"], mock_response["hash"])
         self.assertEqual(result["height"], mock_response["height"])
         self.assertEqual(result["time"], mock_response["time"])
@@ -65,8 +75,105 @@ class TestBlockchainService(unittest.TestCase):
         self.assertEqual(result["mrkl_root"], mock_response["mrkl_root"])
         self.assertEqual(result["txids"], mock_response["txids"])
     
-    @patch('blockcypher.get_block_overview')
-    def test_get_block_overview(self, mock_get_block_overview):
+    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
+    def test_get_block_details_with_fields(self, mock_make_request):
+        """Test that a field projection returns only the requested keys."""
+        # Mock response
+        mock_make_request.return_value = {"hash": "hash_680000", "height": 680000, "txids": ["tx1", "tx2"]}
+        
+        # Call the method
+        result = self.blockchain_service.get_block_details(680000, fields=("hash", "height"))
+        
+        # Assertions
+        self.assertEqual(result, {"hash": "hash_680000", "height": 680000})
+    
+    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
+    def test_get_block_details_error_is_chained(self, mock_make_request):
+        """Test that API failures raise BlockCypherError with the cause attached."""
+        # Mock a rate-limited response
+        cause = HTTPError("429 Too Many Requests", response=MagicMock(status_code=429))
+        mock_make_request.side_effect = cause
+        
+        # Call the method
+        with self.assertRaises(BlockCypherError) as context:
+            self.blockchain_service.get_block_details(680000)
+        
+        # Assertions
+        self.assertIs(context.exception.__cause__, cause)
+        self.assertEqual(context.exception.status_code, 429)
+    
+    def test_injected_session_is_used_and_closed(self):
+        """Test that a provider uses and closes the session it was given."""
+        session = MagicMock(spec=requests.Session)
+        session.request.return_value.content = b'{"hash": "hash_680000", "height": 680000}'
+        
+        with BlockchainService(api_token=self.api_token, session=session) as service:
+            result = service.get_block_overview(680000)
+            self.assertIs(service.wallet_manager.session, session)
+        
+        # Assertions
+        session.request.assert_called_once()
+        session.close.assert_called_once()
+        self.assertEqual(result["height"], 680000)
+    
+    def test_shared_session_is_not_closed(self):
+        """Test that close() leaves the per-thread default session open."""
+        with patch.object(self.blockchain_service.session, 'close') as mock_close:
+            self.blockchain_service.close()
+        
+        mock_close.assert_not_called()
+    
+    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
+    def test_get_block_details_many(self, mock_make_request):
+        """Test getting details for several blocks in one batched request."""
+        # Mock response (batch results are not guaranteed to be in request order)
+        mock_make_request.return_value = [
+            {"hash": "hash_680001", "height": 680001, "txids": ["tx3"]},
+            {"hash": "hash_680000", "height": 680000, "txids": ["tx1", "tx2"]}
+        ]
+        
+        # Call the method
+        result = self.blockchain_service.get_block_details_many([680000, 680001])
+        
+        # Assertions
+        mock_make_request.assert_called_once_with('GET', 'blocks/680000;680001', params=None)
+        self.assertEqual(result[680000]["hash"], "hash_680000")
+        self.assertEqual(result[680000]["txids"], ["tx1", "tx2"])
+        self.assertEqual(result[680001]["hash"], "hash_680001")
+        self.assertIsNone(result[680001]["fees"])
+    
+    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
+    def test_get_block_details_many_splits_batches(self, mock_make_request):
+        """Test that large height lists are split into MAX_BATCH_SIZE requests."""
+        # Mock response: a single-item batch returns an object, not a list
+        mock_make_request.side_effect = [
+            [{"height": 1}, {"height": 2}],
+            {"height": 3}
+        ]
+        
+        # Call the method with a reduced batch size
+        with patch.object(BlockchainService, 'MAX_BATCH_SIZE', 2):
+            result = self.blockchain_service.get_block_details_many([1, 2, 3])
+        
+        # Assertions
+        self.assertEqual(mock_make_request.call_count, 2)
+        mock_make_request.assert_any_call('GET', 'blocks/1;2', params=None)
+        mock_make_request.assert_any_call('GET', 'blocks/3', params=None)
+        self.assertEqual(sorted(result), [1, 2, 3])
+    
+    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
+    def test_get_block_details_many_malformed_response(self, mock_make_request):
+        """Test that a malformed batch response surfaces as a BlockCypherError."""
+        mock_make_request.return_value = ["not a block"]
+        
+        with self.assertRaises(BlockCypherError) as context:
+            self.blockchain_service.get_block_details_many([680000])
+        
+        # Assertions
+        self.assertIsInstance(context.exception.__cause__, AttributeError)
+    
+    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
+    def test_get_block_overview(self, mock_make_request):
         """Test getting block overview."""
         # Mock response
         mock_response = {
@@ -75,17 +182,17 @@ class TestBlockchainService(unittest.TestCase):
             "time": "2021-04-01T01:23:45Z",
             "n_tx": 1000
         }
-        mock_get_block_overview.return_value = mock_response
+        mock_make_request.return_value = mock_response
         
         # Call the method
         result = self.blockchain_service.get_block_overview(680000)
         
         # Assertions
-        mock_get_block_overview.assert_called_once_with(680000, coin_symbol="btc-testnet")
+        mock_make_request.assert_called_once_with('GET', 'blocks/680000')
         self.assertEqual(result, mock_response)
     
-    @patch('blockcypher.get_blockchain_overview')
-    def test_get_network_info(self, mock_get_blockchain_overview):
+    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
+    def test_get_network_info(self, mock_make_request):
         """Test getting network information."""
         # Mock response
         mock_response = {
@@ -102,17 +209,17 @@ class TestBlockchainService(unittest.TestCase):
             "medium_fee_per_kb": 25000,
             "low_fee_per_kb": 10000
         }
-        mock_get_blockchain_overview.return_value = mock_response
+        mock_make_request.return_value = mock_response
         
         # Call the method
         result = self.blockchain_service.get_network_info()
         
         # Assertions
-        mock_get_blockchain_overview.assert_called_once_with(coin_symbol="btc-testnet")
+        mock_make_request.assert_called_once_with('GET', '')
         self.assertEqual(result, mock_response)
     
-    @patch('blockcypher.get_blockchain_overview')
-    def test_get_fee_estimates(self, mock_get_blockchain_overview):
+    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
+    def test_get_fee_estimates(self, mock_make_request):
         """Test getting fee estimates."""
         # Mock response
         mock_response = {
@@ -120,17 +227,52 @@ class TestBlockchainService(unittest.TestCase):
             "medium_fee_per_kb": 25000,
             "low_fee_per_kb": 10000
         }
-        mock_get_blockchain_overview.return_value = mock_response
+        mock_make_request.return_value = mock_response
         
         # Call the method
         result = self.blockchain_service.get_fee_estimates()
         
         # Assertions
-        mock_get_blockchain_overview.assert_called_once_with(coin_symbol="btc-testnet")
+        mock_make_request.assert_called_once_with('GET', '')
         self.assertEqual(result["high_fee_per_kb"], mock_response["high_fee_per_kb"])
         self.assertEqual(result["medium_fee_per_kb"], mock_response["medium_fee_per_kb"])
         self.assertEqual(result["low_fee_per_kb"], mock_response["low_fee_per_kb"])
     
+    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
+    def test_network_reads_are_cached_until_refresh(self, mock_make_request):
+        """Test that block height and network info are served from cache until refresh()."""
+        # Mock response (the chain endpoint serves both height and network info)
+        mock_make_request.return_value = {"height": 680000, "high_fee_per_kb": 50000}
+        
+        # Repeated calls, including fee estimates sharing the network overview
+        self.assertEqual(self.blockchain_service.get_latest_block_height(), 680000)
+        self.assertEqual(self.blockchain_service.get_latest_block_height(), 680000)
+        self.blockchain_service.get_network_info()
+        self.assertEqual(self.blockchain_service.get_fee_estimates()["high_fee_per_kb"], 50000)
+        
+        # Assertions: height and network info share one request
+        mock_make_request.assert_called_once_with('GET', '')
+        
+        # After a refresh the API is queried again
+        self.blockchain_service.refresh()
+        self.blockchain_service.get_latest_block_height()
+        self.blockchain_service.get_network_info()
+        self.assertEqual(mock_make_request.call_count, 2)
+    
+    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
+    def test_network_parameters_shared_across_instances(self, mock_make_request):
+        """Test that network parameters are fetched once per coin for all providers."""
+        mock_make_request.return_value = {"height": 680000}
+        
+        # Two providers on the same network
+        first = BlockchainService(api_token=self.api_token).get_network_parameters()
+        second = BlockchainService(api_token=self.api_token).get_network_parameters()
+        
+        # Assertions
+        mock_make_request.assert_called_once_with('GET', '')
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+    
     @patch('app.infrastructure.providers.blockcypher.wallets.WalletManager.get_wallet_balance')
     def test_get_address_balance_deprecation(self, mock_get_wallet_balance):
         """Test that the get_address_balance method is deprecated and calls the appropriate method."""
@@ -171,14 +313,83 @@ class TestBlockchainService(unittest.TestCase):
             # Call the method
             result = self.blockchain_service.get_address_details("tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx")
             
+            # Repeated calls do not warn again
+            self.blockchain_service.get_address_details("tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx")
+            
             # Check that a deprecation warning was issued
             self.assertEqual(len(w), 1)
             self.assertTrue(issubclass(w[0].category, DeprecationWarning))
             self.assertIn("Use WalletManager.get_wallet_details() instead", str(w[0].message))
         
         # Assertions
-        mock_get_wallet_details.assert_called_once()
+        self.assertEqual(mock_get_wallet_details.call_count, 2)
         self.assertEqual(result, mock_response)
 
+class TestAsyncBlockchainService(unittest.IsolatedAsyncioTestCase):
+    """Tests for the AsyncBlockchainService class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.requests = []
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(self._handle))
+        self.blockchain_service = AsyncBlockchainService(
+            api_token="test_token", client=self.client, rate_limiter=AsyncRateLimiter(max_rate=1000)
+        )
+        # Network parameters are cached across instances; start each test cold
+        AsyncBlockchainService._network_params_cache.clear()
+    
+    async def asyncTearDown(self):
+        """Close the shared client."""
+        await self.client.aclose()
+    
+    def _handle(self, request):
+        """Answer requests like the BlockCypher API would."""
+        self.requests.append(request)
+        path = request.url.path.rstrip("/")
+        if path == "/v1/btc/test3":
+            return httpx.Response(200, json={"height": 680000, "high_fee_per_kb": 50000})
+        if path == "/v1/btc/test3/blocks/680000":
+            return httpx.Response(200, json={"hash": "hash_680000", "height": 680000, "txids": ["tx1"]})
+        return httpx.Response(404, json={"error": "not found"})
+    
+    async def test_get_latest_block_height_is_cached(self):
+        """Test that the block height is fetched once and sent with the token."""
+        self.assertEqual(await self.blockchain_service.get_latest_block_height(), 680000)
+        self.assertEqual(await self.blockchain_service.get_latest_block_height(), 680000)
+        
+        # Assertions
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(self.requests[0].url.params["token"], "test_token")
+    
+    async def test_get_block_details(self):
+        """Test getting block details."""
+        result = await self.blockchain_service.get_block_details(680000)
+        
+        # Assertions
+        self.assertEqual(result["hash"], "hash_680000")
+        self.assertEqual(result["txids"], ["tx1"])
+        self.assertIsNone(result["fees"])
+    
+    async def test_get_fee_estimates(self):
+        """Test that fee estimates come from the network overview."""
+        result = await self.blockchain_service.get_fee_estimates()
+        
+        # Assertions
+        self.assertEqual(result["high_fee_per_kb"], 50000)
+        self.assertEqual(result["low_fee_per_kb"], 0)
+    
+    async def test_http_error_is_wrapped(self):
+        """Test that API errors surface as a descriptive exception."""
+        with self.assertRaises(Exception) as context:
+            await self.blockchain_service.get_block_overview(1)
+        
+        self.assertIn("Failed to get block overview", str(context.exception))
+    
+    async def test_injected_client_is_not_closed(self):
+        """Test that aclose() leaves an injected client open."""
+        await self.blockchain_service.aclose()
+        
+        self.assertFalse(self.client.is_closed)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
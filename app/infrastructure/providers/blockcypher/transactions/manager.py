@@ -21,6 +21,9 @@ class TransactionManager(BlockCypherProvider):
     This class provides methods for creating, sending, and monitoring transactions.
     """
     
+    # Number of batched lookups get_transactions_many() runs concurrently
+    BATCH_WORKERS = 4
+    
     def create_transaction(
         self,
         inputs: List[Dict[str, Any]],
@@ -43,19 +46,15 @@ class TransactionManager(BlockCypherProvider):
             Transaction skeleton
         """
         try:
+            # Optional fees and any additional parameters are merged in one literal
             tx_data = {
                 "inputs": inputs,
                 "outputs": outputs,
-                "preference": preference
+                "preference": preference,
+                **({"fees": fees} if fees is not None else {}),
+                **kwargs
             }
             
-            # Add optional fees if provided
-            if fees is not None:
-                tx_data["fees"] = fees
-                
-            # Add any additional parameters
-            tx_data.update(kwargs)
-            
             return self.make_request('POST', 'txs/new', data=tx_data)
         except RequestException as e:
             raise Exception(f"Failed to create transaction: {str(e)}")
@@ -129,6 +128,28 @@ class TransactionManager(BlockCypherProvider):
         except RequestException as e:
             raise Exception(f"Failed to get transaction {tx_hash}: {str(e)}")
     
+    def get_transactions_many(self, tx_hashes: List[TransactionHash],
+                              include_confidence: bool = False) -> Dict[TransactionHash, TransactionInfo]:
+        """
+        Get information about several transactions using batched requests.
+        
+        Hashes are sent MAX_BATCH_SIZE at a time, with up to BATCH_WORKERS
+        batches in flight, instead of one request per transaction.
+        
+        Args:
+            tx_hashes: Transaction hashes/IDs
+            include_confidence: Whether to include confidence information for unconfirmed transactions
+            
+        Returns:
+            Dictionary mapping each transaction hash to its information
+        """
+        try:
+            params = {'includeConfidence': 'true'} if include_confidence else None
+            results = self.make_batch_request('txs', tx_hashes, params=params, max_workers=self.BATCH_WORKERS)
+            return {result.get("hash"): result for result in results}
+        except RequestException as e:
+            raise Exception(f"Failed to get transactions: {str(e)}")
+    
     def get_transaction_confidence(self, tx_hash: str) -> Dict[str, Any]:
         """
         Get confidence information for an unconfirmed transaction.
@@ -178,15 +199,11 @@ class TransactionManager(BlockCypherProvider):
             # Create transaction skeleton
             tx_data = {
                 "inputs": [{"addresses": [from_address]}],
-                "outputs": [{"addresses": [to_address], "value": amount_satoshis}]
+                "outputs": [{"addresses": [to_address], "value": amount_satoshis}],
+                **({"fees": fees} if fees is not None else {}),
+                **kwargs
             }
             
-            if fees is not None:
-                tx_data["fees"] = fees
-                
-            # Add any additional parameters
-            tx_data.update(kwargs)
-            
             tx_skeleton = self.make_request('POST', 'txs/new', data=tx_data)
             
             # Sign the transaction
@@ -219,6 +219,25 @@ class TestTransactionManager(unittest.TestCase):
         )
         self.assertEqual(result, mock_response)
     
+    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
+    def test_get_transactions_many(self, mock_make_request):
+        """Test fetching several transactions with batched requests."""
+        # Mock response: one batch per call, in arbitrary order
+        mock_make_request.side_effect = lambda method, endpoint, params=None: [
+            {"hash": tx_hash, "confirmations": 1} for tx_hash in endpoint[len('txs/'):].split(';')
+        ]
+        
+        # Call the method with a reduced batch size
+        with patch.object(TransactionManager, 'MAX_BATCH_SIZE', 2):
+            result = self.transaction_manager.get_transactions_many(["tx1", "tx2", "tx3"], include_confidence=True)
+        
+        # Assertions
+        self.assertEqual(mock_make_request.call_count, 2)
+        mock_make_request.assert_any_call('GET', 'txs/tx1;tx2', params={'includeConfidence': 'true'})
+        mock_make_request.assert_any_call('GET', 'txs/tx3', params={'includeConfidence': 'true'})
+        self.assertEqual(sorted(result), ["tx1", "tx2", "tx3"])
+        self.assertEqual(result["tx3"]["confirmations"], 1)
+    
     @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
     def test_get_transaction_confidence(self, mock_make_request):
         """Test getting transaction confidence."""
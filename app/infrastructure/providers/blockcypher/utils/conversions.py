@@ -6,13 +6,14 @@ of cryptocurrency (e.g., BTC to satoshis).
 """
 
 from typing import Union, Dict, Optional, Any
-from decimal import Decimal, getcontext
+from decimal import ROUND_DOWN, Decimal, getcontext
 
 # Set decimal precision
 getcontext().prec = 28
 
 # Conversion constants
 SATOSHI_PER_BTC = 100_000_000  # 1 BTC = 100,000,000 satoshis
+_SATOSHI_SCALE = Decimal(SATOSHI_PER_BTC)  # Built once instead of on every conversion
 
 def satoshi_to_btc(satoshi_amount: Union[int, str]) -> float:
     """
@@ -25,7 +26,7 @@ def satoshi_to_btc(satoshi_amount: Union[int, str]) -> float:
         Equivalent amount in BTC
     """
     amount = int(satoshi_amount)
-    return float(Decimal(amount) / Decimal(SATOSHI_PER_BTC))
+    return float(Decimal(amount) / _SATOSHI_SCALE)
 
 def btc_to_satoshi(btc_amount: Union[float, str]) -> int:
     """
@@ -35,10 +36,10 @@ def btc_to_satoshi(btc_amount: Union[float, str]) -> int:
         btc_amount: Amount in BTC
         
     Returns:
-        Equivalent amount in satoshis
+        Equivalent amount in satoshis (sub-satoshi precision is truncated)
     """
     amount = Decimal(str(btc_amount))  # Convert to Decimal from either float or string
-    return int(amount * Decimal(SATOSHI_PER_BTC))
+    return int((amount * _SATOSHI_SCALE).to_integral_value(ROUND_DOWN))
 
 def format_btc_amount(amount: float, include_symbol: bool = True) -> str:
     """
@@ -64,5 +65,8 @@ def format_satoshi_amount(amount: int) -> str:
     Returns:
         Formatted amount string
     """
-    btc_equivalent = satoshi_to_btc(amount)
-    return f"{amount:,} satoshis ({format_btc_amount(btc_equivalent)})" 
\ No newline at end of file
+    # Integer split keeps every satoshi exact, unlike a round trip through float
+    whole, fraction = divmod(abs(amount), SATOSHI_PER_BTC)
+    sign = '-' if amount < 0 else ''
+    btc_equivalent = f"{sign}{whole}.{fraction:08d}".rstrip('0').rstrip('.')
+    return f"{amount:,} satoshis ({btc_equivalent} BTC)" 
\ No newline at end of file
@@ -8,6 +8,6 @@ This package contains wallet-related functionality such as:
 - Multi-signature wallets
 """
 
-from app.infrastructure.providers.blockcypher.wallets.manager import WalletManager
+from app.infrastructure.providers.blockcypher.wallets.manager import AsyncWalletManager, WalletManager
 
-__all__ = ['WalletManager'] 
\ No newline at end of file
+__all__ = ['WalletManager', 'AsyncWalletManager'] 
\ No newline at end of file
@@ -5,10 +5,15 @@ This module provides functionality for managing cryptocurrency wallets,
 including creating wallets, generating addresses, and querying balances.
 """
 
+import asyncio
+import httpx
 from typing import Dict, Any, List, Optional, Union
 from requests.exceptions import RequestException
 
+from app.infrastructure.providers.blockcypher.common.async_base import AsyncBlockCypherProvider
 from app.infrastructure.providers.blockcypher.common.base import BlockCypherProvider
+from app.infrastructure.providers.blockcypher.common.exceptions import BlockCypherError
+from app.infrastructure.providers.blockcypher.common.projections import project_address
 from app.infrastructure.providers.blockcypher.common.types import (
     Address, WalletInfo, AddressInfo, CoinSymbol
 )
@@ -248,15 +253,25 @@ class WalletManager(BlockCypherProvider):
         """
         try:
             result = self.make_request('GET', f'addrs/{address}')
+            return project_address(address, result)
+        except RequestException as e:
+            raise Exception(f"Failed to get wallet details: {str(e)}")
+    
+    def get_wallet_details_many(self, addresses: List[str]) -> Dict[str, AddressInfo]:
+        """
+        Get detailed information about several addresses using batched requests.
+        
+        Args:
+            addresses: The addresses to get details for
             
+        Returns:
+            Dictionary mapping each address to its details
+        """
+        try:
+            results = self.make_batch_request('addrs', addresses)
             return {
-                "address": address,
-                "balance": result.get("balance", 0),
-                "total_received": result.get("total_received", 0),
-                "total_sent": result.get("total_sent", 0),
-                "n_tx": result.get("n_tx", 0),
-                "unconfirmed_balance": result.get("unconfirmed_balance", 0),
-                "final_balance": result.get("final_balance", 0)
+                result.get("address"): project_address(result.get("address"), result)
+                for result in results
             }
         except RequestException as e:
             raise Exception(f"Failed to get wallet details: {str(e)}")
@@ -352,4 +367,107 @@ class WalletManager(BlockCypherProvider):
             data = {"addresses": addresses}
             return self.make_request('POST', f'wallets/{wallet_name_or_id}/addresses', data=data)
         except RequestException as e:
-            raise Exception(f"Failed to add addresses to wallet {wallet_name_or_id}: {str(e)}") 
\ No newline at end of file
+            raise Exception(f"Failed to add addresses to wallet {wallet_name_or_id}: {str(e)}") 
+
+
+class AsyncWalletManager(AsyncBlockCypherProvider):
+    """
+    Asynchronous counterpart of WalletManager's read operations.
+    
+    Lookups for several addresses are issued concurrently, so N independent
+    requests cost roughly one round trip of wall time.
+    """
+    
+    async def get_wallet(self, wallet_name: str) -> WalletInfo:
+        """
+        Get information about a specific wallet.
+        
+        Args:
+            wallet_name: Name of the wallet to retrieve
+            
+        Returns:
+            Dictionary with wallet information
+        """
+        try:
+            return await self.make_request('GET', f'wallets/{wallet_name}')
+        except httpx.HTTPError as e:
+            raise BlockCypherError(f"Failed to get wallet {wallet_name}") from e
+    
+    async def get_wallet_balance(self, address: str) -> Dict[str, Any]:
+        """
+        Get the balance of a wallet address in the native coin unit (BTC, LTC, etc.)
+        
+        Args:
+            address: The address to check
+            
+        Returns:
+            Dictionary with balance information
+        """
+        try:
+            return await self.make_request('GET', f'wallets/{address}/balance')
+        except httpx.HTTPError as e:
+            raise BlockCypherError("Failed to get wallet balance") from e
+    
+    async def get_wallet_details(self, address: str) -> AddressInfo:
+        """
+        Get detailed information about a wallet address.
+        
+        Args:
+            address: The address to get details for
+            
+        Returns:
+            Address information details
+        """
+        try:
+            result = await self.make_request('GET', f'addrs/{address}')
+            return project_address(address, result)
+        except httpx.HTTPError as e:
+            raise BlockCypherError("Failed to get wallet details") from e
+    
+    async def get_wallet_details_many(self, addresses: List[str]) -> Dict[str, AddressInfo]:
+        """
+        Get detailed information about several addresses using concurrent batched requests.
+        
+        Args:
+            addresses: The addresses to get details for
+            
+        Returns:
+            Dictionary mapping each address to its details
+        """
+        try:
+            results = await self.make_batch_request('addrs', addresses)
+            return {
+                result.get("address"): project_address(result.get("address"), result)
+                for result in results
+            }
+        except httpx.HTTPError as e:
+            raise BlockCypherError("Failed to get wallet details") from e
+    
+    async def get_raw_balance(self, address: str) -> int:
+        """
+        Get the total balance of a wallet address in satoshis (or equivalent smallest unit).
+        
+        Args:
+            address: The address to check
+            
+        Returns:
+            Balance in satoshis (or equivalent smallest unit)
+        """
+        try:
+            result = await self.make_request('GET', f'addrs/{address}/balance')
+            return result.get("balance", 0)
+        except httpx.HTTPError as e:
+            raise BlockCypherError("Failed to get raw balance") from e
+    
+    async def get_raw_balances(self, addresses: List[str]) -> Dict[str, int]:
+        """
+        Get the balances of several addresses in satoshis, fetched concurrently.
+        
+        Args:
+            addresses: The addresses to check
+            
+        Returns:
+            Dictionary mapping each address to its balance
+        """
+        balances = await asyncio.gather(*(self.get_raw_balance(address) for address in addresses))
+        return dict(zip(addresses, balances))
@@ -7,7 +7,11 @@ from unittest.mock import patch, MagicMock
 import pytest
 import os
 
-from app.infrastructure.providers.blockcypher.wallets import WalletManager
+import httpx
+
+from app.infrastructure.providers.blockcypher.common.exceptions import BlockCypherError
+from app.infrastructure.providers.blockcypher.common.rate_limit import AsyncRateLimiter
+from app.infrastructure.providers.blockcypher.wallets import AsyncWalletManager, WalletManager
 
 class TestWalletManager(unittest.TestCase):
     """Tests for the WalletManager class."""
@@ -308,6 +312,24 @@ class TestWalletManager(unittest.TestCase):
         mock_make_request.assert_called_once_with('GET', 'addrs/tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx/balance')
         self.assertEqual(result, mock_response)
     
+    @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
+    def test_get_wallet_details_many(self, mock_make_request):
+        """Test getting details for several addresses in one batched request."""
+        # Mock response
+        mock_make_request.return_value = [
+            {"address": "addr_2", "balance": 2000, "n_tx": 2},
+            {"address": "addr_1", "balance": 1000, "n_tx": 1}
+        ]
+        
+        # Call the method
+        result = self.wallet_manager.get_wallet_details_many(["addr_1", "addr_2"])
+        
+        # Assertions
+        mock_make_request.assert_called_once_with('GET', 'addrs/addr_1;addr_2', params=None)
+        self.assertEqual(result["addr_1"]["balance"], 1000)
+        self.assertEqual(result["addr_2"]["n_tx"], 2)
+        self.assertEqual(result["addr_2"]["total_sent"], 0)
+    
     @patch('app.infrastructure.providers.blockcypher.common.base.BlockCypherProvider.make_request')
     def test_get_address_transactions(self, mock_make_request):
         """Test getting address transactions."""
@@ -339,6 +361,63 @@ class TestWalletManager(unittest.TestCase):
         self.assertEqual(result, mock_response)
 
 
+class TestAsyncWalletManager(unittest.IsolatedAsyncioTestCase):
+    """Tests for the AsyncWalletManager class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.paths = []
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(self._handle))
+        self.wallet_manager = AsyncWalletManager(
+            api_token="test_token", client=self.client, rate_limiter=AsyncRateLimiter(max_rate=1000)
+        )
+    
+    async def asyncTearDown(self):
+        """Close the shared client."""
+        await self.client.aclose()
+    
+    def _handle(self, request):
+        """Answer address lookups like the BlockCypher API would."""
+        self.paths.append(request.url.path)
+        resource = request.url.path.split('/addrs/')[1]
+        if resource.endswith('/balance'):
+            address = resource[:-len('/balance')]
+            return httpx.Response(200, json={"address": address, "balance": len(address)})
+        return httpx.Response(200, json=[{"address": address, "balance": 1} for address in resource.split(';')])
+    
+    async def test_get_raw_balances(self):
+        """Test fetching several balances concurrently."""
+        result = await self.wallet_manager.get_raw_balances(["addr1", "addr22"])
+        
+        # Assertions
+        self.assertEqual(result, {"addr1": 5, "addr22": 6})
+        self.assertEqual(len(self.paths), 2)
+    
+    async def test_get_wallet_details_many(self):
+        """Test that batches are fetched concurrently and merged."""
+        with patch.object(AsyncWalletManager, 'MAX_BATCH_SIZE', 2):
+            result = await self.wallet_manager.get_wallet_details_many(["addr1", "addr2", "addr3"])
+        
+        # Assertions
+        self.assertEqual(sorted(self.paths), ["/v1/btc/test3/addrs/addr1;addr2", "/v1/btc/test3/addrs/addr3"])
+        self.assertEqual(sorted(result), ["addr1", "addr2", "addr3"])
+        self.assertEqual(result["addr3"]["total_sent"], 0)
+    
+    async def test_http_error_is_wrapped(self):
+        """Test that API errors surface as a BlockCypherError chained to the HTTP error."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(429, json={"error": "rate limited"}))
+        async with httpx.AsyncClient(transport=transport) as client:
+            wallet_manager = AsyncWalletManager(
+                api_token="test_token", client=client, rate_limiter=AsyncRateLimiter(max_rate=1000)
+            )
+            with self.assertRaises(BlockCypherError) as context:
+                await wallet_manager.get_wallet("alice")
+        
+        # Assertions
+        self.assertIn("Failed to get wallet alice", str(context.exception))
+        self.assertEqual(context.exception.status_code, 429)
+
+
 # Real tests using the BlockCypher test faucet
 # These tests will only run if the BLOCKCYPHER_LIVE_TEST environment variable is set to 'true'
 @pytest.mark.skipif(
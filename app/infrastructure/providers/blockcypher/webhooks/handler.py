@@ -5,12 +5,15 @@ This module contains the handler for BlockCypher webhook callbacks for blockchai
 including transaction notifications and confirmations.
 """
 
-import json
 import hmac
 import hashlib
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
+import orjson
+
+from app.infrastructure.providers.blockcypher.utils.conversions import satoshi_to_btc
+
 # In a real application, you would use a database instead of this in-memory storage
 transaction_db = {}
 
@@ -106,12 +109,13 @@ class BlockcypherWebhookHandler:
             for output in data.get('outputs', []):
                 if address in output.get('addresses', []):
                     value_satoshis += output.get('value', 0)
+            value_btc = satoshi_to_btc(value_satoshis)
                     
             # Save transaction to our database
             transaction_db[tx_hash] = {
                 'address': address,
                 'value_satoshis': value_satoshis,
-                'value_btc': value_satoshis / 100000000.0,  # Convert to BTC
+                'value_btc': value_btc,
                 'confirmations': 0,
                 'status': 'unconfirmed',
                 'timestamp': datetime.now().isoformat(),
@@ -122,7 +126,7 @@ class BlockcypherWebhookHandler:
             # 1. Record the payment in your database
             # 2. Update user account/credits
             # 3. Mark invoice as "pending confirmation"
-            print(f"Unconfirmed payment of {value_satoshis / 100000000.0} BTC to {address} detected")
+            print(f"Unconfirmed payment of {value_btc} BTC to {address} detected")
             
             return {
                 "received": True,
@@ -285,4 +289,4 @@ def simulate_webhook(event_type: str = 'unconfirmed-tx',
     
     # Process the simulated webhook
     handler = BlockcypherWebhookHandler()
-    return handler.handle_payment_webhook(json.dumps(simulated_data).encode(), simulated_data) 
\ No newline at end of file
+    return handler.handle_payment_webhook(orjson.dumps(simulated_data), simulated_data) 
\ No newline at end of file
@@ -1,14 +1,30 @@
+from contextlib import asynccontextmanager
+
+from anyio import to_thread
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core.cache import close_redis, init_redis
 from app.core.config import settings
 from app.core.database import engine
 from app.infrastructure import models
 
-# Create database tables
-models.Base.metadata.create_all(bind=engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Cap the threadpool used for sync endpoints and background tasks
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_MAX_WORKERS
+    # Create database tables at startup rather than as an import side effect
+    await to_thread.run_sync(models.Base.metadata.create_all, engine)
+    await init_redis()
+    yield
+    await close_redis()
+
 
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     openapi_url=f"{settings.API_V1_STR}/openapi.json"